@@ -0,0 +1,397 @@
+"""
+Differential harness checking fast paths against the reference Money implementation.
+
+Every case generates random inputs, runs them through the reference (plain ``Money``
+objects, ``xrates`` conversions and Babel) and through a fast engine, then reports any
+divergence together with the time taken by each side. Results are compared exactly:
+Decimals (and Money amounts) must be identical under ``compare_total``, so ``2.5`` and
+``2.50`` diverge. Cases may declare an explicit relative tolerance, in which case exact
+mismatches within it are reported separately and don't fail the run.
+
+Every case runs against each rate set of :data:`RATE_SETS`: ``exact`` rates keep every
+quotation terminating, ``realistic`` rates don't.
+
+Usage: python -m benchmarks.equivalence [--runs N] [--seed N] [--rates NAME]
+"""
+
+import argparse
+import functools
+import operator
+import random
+import sys
+import time
+from contextlib import contextmanager
+from decimal import Decimal
+
+import money
+from money import Money, MoneyArray, xrates
+from money.exchange import GraphBackend, SimpleBackend
+from money.localedata import LocaleData
+
+CURRENCIES = ('USD', 'EUR', 'JPY', 'KWD', 'CLF')
+LOCALES = ('en_US', 'pt_PT', 'de_DE', 'ja_JP')
+
+BASE = 'USD'
+RATE_SETS = {
+    # Rates of the form 2^i * 5^j keep every quotation and inverse terminating.
+    'exact': {'EUR': Decimal('1.25'), 'JPY': Decimal(160), 'KWD': Decimal('0.3125'), 'CLF': Decimal('0.04')},
+    'realistic': {'EUR': Decimal('0.9234'), 'JPY': Decimal('149.87'), 'KWD': Decimal('0.30781'), 'CLF': Decimal('0.026317')},
+}
+
+
+class Case:
+    """
+    A fast engine checked against a reference.
+
+    Parameters
+    ----------
+    name: str
+        The name shown in the report
+    generate: callable
+        Returns one random input given a ``random.Random``
+    reference: callable
+        Maps a list of inputs to a list of expected outputs
+    fast: callable
+        Maps a list of inputs to a list of outputs, expected to equal the reference. Cases
+        without a fast engine yet (``None``) run the reference twice as a smoke check and
+        are where one gets plugged in
+    tolerance: Decimal
+        Relative difference accepted between Decimal results, exact if None
+    """
+
+    def __init__(self, name, generate, reference, fast=None, tolerance=None):
+        self.name = name
+        self.generate = generate
+        self.reference = reference
+        self.fast = fast
+        self.tolerance = tolerance
+
+
+class Result:
+    """
+    Outcome of running a case with a rate set.
+
+    ``divergences`` and ``tolerated`` hold (input, expected, actual) triples respectively
+    beyond and within the tolerance of the case.
+    """
+
+    def __init__(self, case, rates, runs, divergences, tolerated, reference_time, fast_time):
+        self.case = case
+        self.rates = rates
+        self.runs = runs
+        self.divergences = divergences
+        self.tolerated = tolerated
+        self.reference_time = reference_time
+        self.fast_time = fast_time
+
+    @property
+    def speedup(self):
+        if self.case.fast is None:
+            return None
+        return self.reference_time / self.fast_time if self.fast_time else float('inf')
+
+
+def random_amount(rng):
+    """Returns a random decimal string, often exactly half way between two minor units."""
+
+    integer = rng.randrange(10 ** rng.randrange(1, 9))
+    digits = rng.randrange(0, 7)
+    fraction = str(rng.randrange(10 ** digits)).zfill(digits) if digits else ''
+    if digits and rng.random() < 0.3:
+        fraction = fraction[:-1] + '5'
+    sign = '-' if rng.random() < 0.3 else ''
+    return f"{sign}{integer}.{fraction}" if fraction else f"{sign}{integer}"
+
+
+def random_money(rng):
+    return Money(random_amount(rng), rng.choice(CURRENCIES))
+
+
+def _amounts_reference(inputs):
+    return [[Money(amount, code).amount for amount in amounts] for amounts, code in inputs]
+
+
+def _amounts_fast(inputs):
+    return [[Decimal(value) for value in MoneyArray.from_decimals(amounts, code)] for amounts, code in inputs]
+
+
+def _sum_reference(inputs):
+    return [sum((Money(amount, code).amount for amount in amounts), Money(0, code).amount) for amounts, code in inputs]
+
+
+def _sum_fast(inputs):
+    return [Decimal(MoneyArray.from_decimals(amounts, code).sum()) for amounts, code in inputs]
+
+
+def _sort_reference(inputs):
+    return [sorted(values) for values in inputs]
+
+
+def _sort_fast(inputs):
+    return [money.sort(values) for values in inputs]
+
+
+def _quotation_reference(inputs):
+    backend = xrates.backend
+    return [backend.quotation(origin, target) for origin, target in inputs]
+
+
+def _quotation_fast(inputs):
+    snapshot = xrates.backend.snapshot()
+    backend = GraphBackend()
+    for code, rate in snapshot.table.items():
+        backend.setquote(snapshot.base, code, rate)
+    return [backend.quotation(origin, target) for origin, target in inputs]
+
+
+def _quotations_fast(inputs):
+    quotations = xrates.backend.quotations(inputs)
+    return [quotations[pair] for pair in inputs]
+
+
+def _total_reference(inputs):
+    return [functools.reduce(operator.add, values) for values in inputs]
+
+
+def _total_fast(inputs):
+    return [money.sum(values) for values in inputs]
+
+
+def _conversion_reference(inputs):
+    return [value.to(target) for value, target in inputs]
+
+
+def _conversion_fast(inputs):
+    keys = {target: money.key_for(target) for target in CURRENCIES}
+    return [Money(keys[target](value), target) for value, target in inputs]
+
+
+def _symbol_reference(inputs):
+    from babel.numbers import get_currency_name, get_currency_symbol
+    return [
+        (get_currency_symbol(code, locale=locale), get_currency_name(code, locale=locale)) for code, locale in inputs
+    ]
+
+
+def _symbol_fast(inputs):
+    data = LocaleData()
+    data.build(CURRENCIES, LOCALES)
+    return [(data.symbol(code, locale), data.display_name(code, locale)) for code, locale in inputs]
+
+
+def _divmod_reference(inputs):
+    return [divmod(a, b) for a, b in inputs]
+
+
+def _pow_reference(inputs):
+    return [value ** exponent for value, exponent in inputs]
+
+
+def _format_reference(inputs):
+    return [value.format(locale) for value, locale in inputs]
+
+
+def _hash_reference(inputs):
+    return [hash((Decimal(value), value.currency.code)) for value in inputs]
+
+
+def _hash_fast(inputs):
+    return [hash(value) for value in inputs]
+
+
+CASES = (
+    Case(
+        'amount (minor units)',
+        lambda rng: ([random_amount(rng) for _ in range(rng.randrange(50))], rng.choice(CURRENCIES)),
+        _amounts_reference, _amounts_fast,
+        # Integer minor units can't hold a negative zero: '-0.00' comes back as '0.00'.
+        tolerance=Decimal(0),
+    ),
+    Case(
+        'sum (minor units)',
+        lambda rng: ([random_amount(rng) for _ in range(rng.randrange(50))], rng.choice(CURRENCIES)),
+        _sum_reference, _sum_fast,
+    ),
+    Case(
+        'sort (key_for)',
+        lambda rng: [random_money(rng) for _ in range(rng.randrange(1, 30))],
+        _sort_reference, _sort_fast,
+    ),
+    Case(
+        'quotation (graph)',
+        lambda rng: (rng.choice(CURRENCIES), rng.choice(CURRENCIES)),
+        _quotation_reference, _quotation_fast,
+        # Path products and base rate ratios round differently in the last digits.
+        tolerance=Decimal('1E-25'),
+    ),
+    Case(
+        'quotations (batch)',
+        lambda rng: (rng.choice(CURRENCIES), rng.choice(CURRENCIES)),
+        _quotation_reference, _quotations_fast,
+    ),
+    Case(
+        'total (batched quotations)',
+        lambda rng: [random_money(rng) for _ in range(rng.randrange(1, 30))],
+        _total_reference, _total_fast,
+    ),
+    Case(
+        'conversion (key_for)',
+        lambda rng: (random_money(rng), rng.choice(CURRENCIES)),
+        _conversion_reference, _conversion_fast,
+    ),
+    Case(
+        'symbol/name (locale data)',
+        lambda rng: (rng.choice(CURRENCIES), rng.choice(LOCALES)),
+        _symbol_reference, _symbol_fast,
+    ),
+    Case(
+        'hash (cached)',
+        random_money,
+        _hash_reference, _hash_fast,
+    ),
+    Case(
+        'divmod (reference only)',
+        lambda rng: (random_money(rng), random_money(rng)),
+        _divmod_reference,
+    ),
+    Case(
+        'pow (reference only)',
+        lambda rng: (random_money(rng), rng.randrange(-3, 4)),
+        _pow_reference,
+    ),
+    Case(
+        'format (reference only)',
+        lambda rng: (random_money(rng), rng.choice(LOCALES)),
+        _format_reference,
+    ),
+)
+
+
+@contextmanager
+def reference_rates(rates='exact'):
+    """Temporarily installs a SimpleBackend with a rate set of :data:`RATE_SETS` as the ``xrates`` backend."""
+
+    previous = xrates.backend
+    backend = SimpleBackend()
+    backend.setrates(RATE_SETS[rates], base=BASE)
+    xrates.backend = backend
+    try:
+        yield backend
+    finally:
+        xrates.backend = previous
+
+
+def run_case(case, runs=1000, seed=0, rates='exact'):
+    """Runs a case on ``runs`` generated inputs with a rate set and returns its :class:`Result`."""
+
+    rng = random.Random(f"{seed}:{case.name}")
+    inputs = [case.generate(rng) for _ in range(runs)]
+    fast = case.fast or case.reference
+
+    with reference_rates(rates):
+        start = time.perf_counter()
+        expected = _outcomes(case.reference, inputs)
+        reference_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        actual = _outcomes(fast, inputs)
+        fast_time = time.perf_counter() - start
+
+    divergences, tolerated = [], []
+    for value, a, b in zip(inputs, expected, actual):
+        if _same(a, b):
+            continue
+        if case.tolerance is not None and _close(a, b, case.tolerance):
+            tolerated.append((value, a, b))
+        else:
+            divergences.append((value, a, b))
+    return Result(case, rates, runs, divergences, tolerated, reference_time, fast_time)
+
+
+def run(cases=CASES, runs=1000, seed=0, rates=tuple(RATE_SETS)):
+    """Runs every case with every given rate set and returns their results."""
+
+    return [run_case(case, runs, seed, name) for name in rates for case in cases]
+
+
+def report(results, limit=3):
+    """Returns a side by side table of divergences and timings, followed by the first divergences."""
+
+    lines = [
+        f"{'case':<28} {'rates':<10} {'runs':>6} {'diverged':>9} {'tolerated':>10} {'tolerance':>10} "
+        f"{'reference s':>12} {'fast s':>10} {'speedup':>8}"
+    ]
+    for result in results:
+        tolerance = '-' if result.case.tolerance is None else f"{result.case.tolerance:.0E}"
+        speedup = '-' if result.speedup is None else f"{result.speedup:.2f}x"
+        lines.append(
+            f"{result.case.name:<28} {result.rates:<10} {result.runs:>6} {len(result.divergences):>9} "
+            f"{len(result.tolerated):>10} {tolerance:>10} "
+            f"{result.reference_time:>12.4f} {result.fast_time:>10.4f} {speedup:>8}"
+        )
+    for result in results:
+        for value, expected, actual in result.divergences[:limit]:
+            lines.append(f"{result.case.name} ({result.rates}): {value!r}: expected {expected!r}, got {actual!r}")
+    return '\n'.join(lines)
+
+
+def _outcomes(engine, inputs):
+    """Maps inputs through an engine, turning a raised exception into its type as the outcome."""
+
+    try:
+        return engine(inputs)
+    except Exception:
+        return [_outcome(engine, value) for value in inputs]
+
+
+def _outcome(engine, value):
+    try:
+        return engine([value])[0]
+    except Exception as e:
+        return type(e)
+
+
+def _same(a, b):
+    """Exact equality: identical Decimal representations and currencies, recursing into lists and tuples."""
+
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    if isinstance(a, Money) or isinstance(b, Money):
+        return (
+            isinstance(a, Money) and isinstance(b, Money)
+            and a.currency == b.currency and Decimal.compare_total(a, b) == 0
+        )
+    if isinstance(a, Decimal) and isinstance(b, Decimal):
+        return a.compare_total(b) == 0
+    return type(a) is type(b) and a == b
+
+
+def _close(a, b, tolerance):
+    """Equality within a relative tolerance, recursing into lists and tuples."""
+
+    if isinstance(a, (list, tuple)) and isinstance(b, (list, tuple)):
+        return len(a) == len(b) and all(_close(x, y, tolerance) for x, y in zip(a, b))
+    if isinstance(a, Money) and isinstance(b, Money) and a.currency != b.currency:
+        return False
+    if isinstance(a, Decimal) and isinstance(b, Decimal):
+        if not a.is_finite() or not b.is_finite():
+            return _same(a, b)
+        a, b = Decimal(a), Decimal(b)
+        return abs(a - b) <= tolerance * max(abs(a), abs(b))
+    return _same(a, b)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=1000, help='generated inputs per case')
+    parser.add_argument('--seed', type=int, default=0, help='random seed')
+    parser.add_argument('--rates', choices=tuple(RATE_SETS), action='append', help='rate sets to run, all by default')
+    args = parser.parse_args()
+
+    results = run(runs=args.runs, seed=args.seed, rates=args.rates or tuple(RATE_SETS))
+    print(report(results))
+    return 1 if any(result.divergences for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Benchmarks dict and set operations keyed by Money and Currency objects.
+
+Usage: python -m benchmarks.hashing [--keys N] [--currencies N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from decimal import Decimal
+
+from money import Currency, Money
+from money._precision import CURRENCY_PRECISION
+
+
+def timed(label, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"{label:<40} {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--keys', type=int, default=1_000_000, help='number of keys')
+    parser.add_argument('--currencies', type=int, default=40, help='number of distinct currencies')
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    codes = sorted(CURRENCY_PRECISION)[:args.currencies]
+    currencies = [Currency(rng.choice(codes)) for _ in range(args.keys)]
+    values = timed('construct Money', lambda: [
+        Money(Decimal(rng.randrange(100_000)).scaleb(-2), currency) for currency in currencies
+    ])
+
+    print(f"{args.keys:,} keys, {len(codes)} currencies")
+
+    timed('dict[Currency] grouping', lambda: _group(currencies))
+    timed('set(Currency)', set, currencies)
+    timed('set(Money) first hash', set, values)
+    timed('set(Money) cached hash', set, values)
+    table = timed('dict[Money] build', dict.fromkeys, values)
+    timed('dict[Money] probe', lambda: sum(1 for value in values if value in table))
+    return 0
+
+
+def _group(currencies):
+    counts = {}
+    for currency in currencies:
+        counts[currency] = counts.get(currency, 0) + 1
+    return counts
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Measures the time taken by ``import money`` using ``python -X importtime``.
+
+Fails (exit status 1) if the best of several runs exceeds the budget, or if Babel
+gets imported eagerly.
+
+Usage: python -m benchmarks.importtime [--budget MS] [--runs N]
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+def measure(module='money'):
+    """Returns the cumulative import time of a module in microseconds and the modules it imported."""
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+
+    cumulative, imported = None, []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, total, name = line.split('|')
+        if not total.strip().isdigit():
+            continue
+        name = name.strip()
+        imported.append(name)
+        if name == module:
+            cumulative = int(total)
+    return cumulative, imported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget', type=float, default=50, help='maximum import time in milliseconds')
+    parser.add_argument('--runs', type=int, default=5, help='number of interpreter runs, the best one is kept')
+    args = parser.parse_args()
+
+    best, imported = None, []
+    for _ in range(args.runs):
+        cumulative, imported = measure()
+        best = cumulative if best is None else min(best, cumulative)
+
+    print(f"import money: {best / 1000:.2f}ms (budget {args.budget:.2f}ms, best of {args.runs})")
+
+    failed = False
+    if any(name == 'babel' or name.startswith('babel.') for name in imported):
+        print('babel was imported eagerly')
+        failed = True
+    if best / 1000 > args.budget:
+        print('import time over budget')
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
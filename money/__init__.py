@@ -1,8 +1,11 @@
 from .currency import Currency
 from .exchange import xrates
 from .money import Money
+from .array import MoneyArray
+from .profiling import profile
+from .sorting import key_for, max, min, sort, sum  # noqa: F401
 
 __name__ = 'money'
 __version__ = '3.1.0'
 
-__all__ = ('Money', 'Currency', 'xrates')
+__all__ = ('Money', 'MoneyArray', 'Currency', 'xrates', 'key_for', 'sort', 'profile')
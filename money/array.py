@@ -0,0 +1,171 @@
+from array import array
+from decimal import Decimal
+
+from money.currency import Currency
+from money.money import Money
+from money.sorting import key_for
+
+
+class MoneyArray:
+    """
+    Represents a column of monetary amounts sharing one currency.
+
+    Amounts are stored as signed 64-bit integers in minor units, the integer ``n`` at
+    exponent ``e`` being the amount ``n * 10 ** -e``. The integers are exposed as a
+    memoryview (and through the buffer protocol on Python 3.12+), so NumPy or
+    ``array.array`` can read them without copying, e.g.
+    ``numpy.frombuffer(column.data, dtype='int64')``.
+
+    Parameters
+    ----------
+    data: buffer or iterable
+        Buffer of signed 64-bit integers (or raw bytes) wrapped without copying, or an
+        iterable of integers copied into a new array
+    currency: Currency or str
+        The currency of every amount
+    exponent: int
+        The number of decimal places of the scaled integers, defaults to the currency precision
+
+    Raises
+    ------
+    ValueError
+        If the given buffer doesn't hold 64-bit integers
+    """
+
+    __slots__ = ('_data', '_currency', '_exponent')
+
+    def __init__(self, data, currency, exponent=None):
+        if not isinstance(currency, Currency):
+            currency = Currency(str(currency))
+        if exponent is None:
+            exponent = currency.precision
+
+        try:
+            view = memoryview(data)
+        except TypeError:
+            view = memoryview(array('q', data))
+
+        if view.format != 'q':
+            if view.itemsize == 8 and view.format.lstrip('@=') in ('q', 'l'):
+                view = view.cast('B').cast('q')
+            elif view.itemsize == 1:
+                if view.nbytes % 8:
+                    raise ValueError(f"Buffer of {view.nbytes} bytes isn't a whole number of 64-bit integers.")
+                view = view.cast('B').cast('q')
+            else:
+                raise ValueError(f"Buffer format '{view.format}' isn't a 64-bit integer.")
+
+        self._data = view
+        self._currency = currency
+        self._exponent = exponent
+
+    @classmethod
+    def from_decimals(cls, values, currency, exponent=None, exact=False):
+        """
+        Returns a new column from decimal values, rounded to the exponent with the Money rounding mode.
+
+        With ``exact`` no rounding is allowed: the exponent defaults to the smallest one, at
+        least the currency precision, that holds every value, and a ValueError is raised if a
+        value can't be stored exactly.
+        """
+
+        if not isinstance(currency, Currency):
+            currency = Currency(str(currency))
+
+        if not exact:
+            if exponent is None:
+                exponent = currency.precision
+
+            rounding = Money._rounding_mode
+            data = array('q')
+            for value in values:
+                try:
+                    data.append(int(Decimal(value).scaleb(exponent).to_integral_value(rounding=rounding)))
+                except OverflowError:
+                    raise ValueError(f"Amount '{value}' doesn't fit in 64 bits with exponent {exponent}.") from None
+            return cls(data, currency, exponent)
+
+        values = [value if isinstance(value, Decimal) else Decimal(value) for value in values]
+        if exponent is None:
+            exponent = currency.precision
+            for value in values:
+                value_exponent = value.as_tuple().exponent
+                if not isinstance(value_exponent, int):
+                    raise ValueError(f"Amount '{value}' isn't finite.")
+                exponent = max(exponent, -value_exponent)
+
+        data = array('q')
+        for value in values:
+            scaled = value.scaleb(exponent)
+            if not scaled.is_finite() or scaled != scaled.to_integral_value() or scaled.scaleb(-exponent) != value:
+                raise ValueError(f"Amount '{value}' can't be stored exactly with exponent {exponent}.")
+            try:
+                data.append(int(scaled))
+            except OverflowError:
+                raise ValueError(f"Amount '{value}' doesn't fit in 64 bits with exponent {exponent}.") from None
+        return cls(data, currency, exponent)
+
+    @classmethod
+    def from_money(cls, values, currency=None, exponent=None):
+        """
+        Returns a new column from money objects.
+
+        ``currency`` defaults to the currency of the first value; values in other
+        currencies are converted to it, quoting all of them in a single batch.
+        """
+
+        values = list(values)
+        if currency is None:
+            if not values:
+                raise ValueError('Currency is required for an empty column.')
+            currency = values[0].currency
+
+        key = key_for(currency, currencies={value.currency for value in values})
+        return cls.from_decimals(map(key, values), currency, exponent)
+
+    @property
+    def data(self):
+        """Returns a memoryview of the scaled integers."""
+
+        return self._data
+
+    @property
+    def currency(self):
+        """Returns the currency."""
+
+        return self._currency
+
+    @property
+    def exponent(self):
+        """Returns the number of decimal places of the scaled integers."""
+
+        return self._exponent
+
+    def sum(self):
+        """Returns the sum of every amount, computed on the scaled integers."""
+
+        return self._to_money(sum(self._data))
+
+    def __buffer__(self, flags):
+        return self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        for value in self._data:
+            yield self._to_money(value)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__class__(self._data[index], self._currency, self._exponent)
+        return self._to_money(self._data[index])
+
+    def __repr__(self):
+        return f"MoneyArray({self._data.tolist()!r}, {self._currency!r}, exponent={self._exponent!r})"
+
+    def __reduce__(self):
+        return self.__class__, (array('q', self._data), self._currency, self._exponent)
+
+    def _to_money(self, value):
+        return Money(Decimal(value).scaleb(-self._exponent), self._currency)
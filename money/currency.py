@@ -1,16 +1,20 @@
 import re
 
-from babel.numbers import get_currency_name, get_currency_precision, get_currency_symbol
-
+from money._precision import CURRENCY_PRECISION
 from money.exceptions import InvalidCurrencyFormat
+from money.localedata import locale_data
 
 CURRENCY_REGEX = re.compile('^[A-Z]{3}$')
 
+_interned = {}
+
 
 class Currency:
     """
     Represents a currency identified by its ISO 4217 code.
 
+    Instances are interned, so creating the same currency twice returns the same object.
+
     Parameters
     ----------
     currency_code: str
@@ -22,13 +26,23 @@ class Currency:
         If the given currency_code isn't a valid ISO 4217 format
     """
 
-    __slots__ = ('_code',)
+    __slots__ = ('_code', '_hash')
+
+    def __new__(cls, currency_code):
+        self = _interned.get(currency_code, None)
+        if self is not None and self.__class__ is cls:
+            return self
 
-    def __init__(self, currency_code):
         if not CURRENCY_REGEX.match(currency_code):
             raise InvalidCurrencyFormat(currency_code)
 
+        self = super().__new__(cls)
         self._code = currency_code
+        self._hash = hash(currency_code)
+
+        if cls is Currency:
+            self = _interned.setdefault(currency_code, self)
+        return self
 
     @property
     def code(self):
@@ -40,17 +54,21 @@ class Currency:
     def precision(self):
         """Returns the precision of this currency."""
 
-        return get_currency_precision(self._code)
+        precision = CURRENCY_PRECISION.get(self._code, None)
+        if precision is None:
+            from babel.numbers import get_currency_precision
+            precision = get_currency_precision(self._code)
+        return precision
 
     def display_name(self, locale='en_US'):
         """Returns the name used by the locale for this currency."""
 
-        return get_currency_name(self._code, locale=locale)
+        return locale_data.display_name(self._code, locale)
 
     def symbol(self, locale='en_US'):
         """Returns the symbol used by the locale for this currency."""
 
-        return get_currency_symbol(self._code, locale=locale)
+        return locale_data.symbol(self._code, locale)
 
     def __repr__(self):
         return f"Currency({self._code!r})"
@@ -61,7 +79,12 @@ class Currency:
     def __reduce__(self):
         return self.__class__, (self._code,)
 
+    def __hash__(self):
+        return self._hash
+
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, Currency):
             return other.code == self._code
         if isinstance(other, str):
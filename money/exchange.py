@@ -1,9 +1,18 @@
 import abc
+import heapq
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
 from importlib import import_module
+from types import MappingProxyType
 
 from money.exceptions import ExchangeBackendNotSet, InvalidExchangeBackend
 
+_UNSET = object()
+
 
 class BaseBackend(abc.ABC):
     """Abstract base class API for exchange backends."""
@@ -26,11 +35,458 @@ class BaseBackend(abc.ABC):
             return b / a
         return None
 
+    def rates(self, currencies):
+        """
+        Returns a dict of quotations between the base and each currency.
+
+        Backends that can fetch several rates in one round trip should override this.
+        """
+
+        return {currency: self.rate(currency) for currency in currencies}
+
+    def quotations(self, pairs):
+        """
+        Returns a dict of quotations for each pair of currencies (origin, target).
+
+        Rates are fetched with a single :meth:`rates` call, unless :meth:`quotation` is
+        overridden, in which case each pair is quoted with it.
+        """
+
+        pairs = list(pairs)
+        if type(self).quotation is not BaseBackend.quotation:
+            return {(origin, target): self.quotation(origin, target) for origin, target in pairs}
+
+        rates = self.rates({currency for pair in pairs for currency in pair})
+
+        quotations = {}
+        for origin, target in pairs:
+            a = rates[origin]
+            b = rates[target]
+            quotations[(origin, target)] = b / a if a and b else None
+        return quotations
+
+
+class RatesSnapshot(BaseBackend):
+    """
+    Immutable point-in-time table of rates against a base currency.
+
+    Snapshots are never modified after creation, so they can be shared between
+    threads and held for the duration of a batch without any locking.
+
+    Parameters
+    ----------
+    base: str
+        The base currency code
+    rates: dict
+        Mapping of currency codes to their rate against the base
+    """
+
+    def __init__(self, base=None, rates=None):
+        self._base = base
+        self._rates = MappingProxyType(dict(rates or {}))
+
+    @property
+    def base(self):
+        return self._base
+
+    @property
+    def table(self):
+        """Returns a read-only mapping of the rates in this snapshot."""
+
+        return self._rates
+
+    def rate(self, currency):
+        if currency == self._base:
+            return Decimal(1)
+        return self._rates.get(currency, None)
+
+    def rates(self, currencies):
+        base, rates = self._base, self._rates
+        return {currency: Decimal(1) if currency == base else rates.get(currency, None) for currency in currencies}
+
+    def replace(self, base=_UNSET, rates=None):
+        """Returns a new snapshot with the given base (which may be None) and rates merged over this one."""
+
+        merged = dict(self._rates)
+        if rates:
+            merged.update(rates)
+        return self.__class__(self._base if base is _UNSET else base, merged)
+
 
 class SimpleBackend(BaseBackend):
+    """
+    In-memory backend with copy-on-write rate snapshots.
+
+    Every update builds a new :class:`RatesSnapshot` and publishes it with a
+    single reference swap. Readers never take a lock and never observe a
+    partially applied update; writers are serialized between themselves.
+    """
+
     def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = RatesSnapshot()
+
+    @property
+    def base(self):
+        return self._snapshot.base
+
+    @base.setter
+    def base(self, currency):
+        with self._lock:
+            self._snapshot = self._snapshot.replace(base=currency)
+
+    def setrate(self, currency, rate):
+        with self._lock:
+            self._snapshot = self._snapshot.replace(rates={currency: rate})
+
+    def setrates(self, rates, base=None):
+        """Atomically publishes several rates (and optionally a new base) at once."""
+
+        with self._lock:
+            self._snapshot = self._snapshot.replace(base=_UNSET if base is None else base, rates=rates)
+
+    def snapshot(self):
+        """Returns the current immutable rates snapshot."""
+
+        return self._snapshot
+
+    def rate(self, currency):
+        return self._snapshot.rate(currency)
+
+    def quotation(self, origin, target):
+        return self._snapshot.quotation(origin, target)
+
+    def rates(self, currencies):
+        return self._snapshot.rates(currencies)
+
+    def quotations(self, pairs):
+        return self._snapshot.quotations(pairs)
+
+
+class RefreshingBackend(BaseBackend):
+    """
+    Keeps rates from a slower loader backend fresh without fetching on the request path.
+
+    Lookups are always answered from the last loaded snapshot. Once a rate is older than
+    its TTL it keeps being served (stale-while-revalidate) and is queued for the refresh
+    worker, which runs in a background thread (:meth:`start`) or an asyncio task
+    (:meth:`start_async`) and backs off exponentially while the loader fails.
+
+    Parameters
+    ----------
+    loader: BaseBackend
+        The backend rates are loaded from
+    ttl: float
+        Seconds a loaded rate is considered fresh
+    ttls: dict
+        Per currency overrides of ``ttl``
+    interval: float
+        Seconds between refresh passes of the worker
+    backoff: float
+        Seconds to wait before retrying after the first loader failure, doubled on every
+        consecutive failure up to ``max_backoff``
+    max_backoff: float
+        Upper bound of the retry delay
+
+    Raises
+    ------
+    InvalidExchangeBackend
+        If the given loader isn't a BaseBackend
+    """
+
+    def __init__(self, loader, ttl=60, ttls=None, interval=1, backoff=1, max_backoff=300, clock=time.monotonic):
+        if not isinstance(loader, BaseBackend):
+            raise InvalidExchangeBackend()
+
+        self._loader = loader
+        self._ttl = ttl
+        self._ttls = dict(ttls or {})
+        self._interval = interval
+        self._backoff = backoff
+        self._max_backoff = max_backoff
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._snapshot = RatesSnapshot()
+        self._loaded_at = {}
+        self._retry_at = {}
+        self._failures = {}
+        self._wanted = set()
+
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+        self._loads = 0
+        self._errors = 0
+        self._load_time = 0.0
+        self._last_load_time = None
+        self._last_error = None
+
+    @property
+    def loader(self):
+        """Returns the backend rates are loaded from."""
+
+        return self._loader
+
+    @property
+    def base(self):
+        return self._snapshot.base
+
+    def snapshot(self):
+        """
+        Returns a view of the current immutable rates snapshot.
+
+        Lookups through the view are answered from the captured rates but still queue
+        stale currencies for refreshing, like lookups on the backend itself.
+        """
+
+        return _RefreshingSnapshot(self, self._snapshot)
+
+    def rate(self, currency):
+        self._touch(currency)
+        return self._snapshot.rate(currency)
+
+    def quotation(self, origin, target):
+        self._touch(origin)
+        self._touch(target)
+        return self._snapshot.quotation(origin, target)
+
+    def rates(self, currencies):
+        currencies = list(currencies)
+        for currency in currencies:
+            self._touch(currency)
+        return self._snapshot.rates(currencies)
+
+    def quotations(self, pairs):
+        pairs = list(pairs)
+        for origin, target in pairs:
+            self._touch(origin)
+            self._touch(target)
+        return self._snapshot.quotations(pairs)
+
+    def staleness(self, currency):
+        """Returns the seconds since the rate of a currency was loaded, or None if it never was."""
+
+        loaded_at = self._loaded_at.get(currency, None)
+        if loaded_at is None:
+            return None
+        return self._clock() - loaded_at
+
+    def metrics(self):
+        """Returns load counters, load times and the staleness of every loaded currency."""
+
+        now = self._clock()
+        return {
+            'loads': self._loads,
+            'errors': self._errors,
+            'load_time': self._load_time,
+            'last_load_time': self._last_load_time,
+            'last_error': self._last_error,
+            'staleness': {currency: now - loaded_at for currency, loaded_at in dict(self._loaded_at).items()},
+        }
+
+    def refresh(self, currencies=None):
+        """
+        Loads the given currencies, or every currency that is due, from the loader.
+
+        Returns False if the loader failed, True otherwise.
+        """
+
+        if currencies is None:
+            currencies = self._due()
+        else:
+            currencies = list(currencies)
+
+        if not currencies:
+            return True
+        return self._load(currencies)
+
+    def start(self):
+        """Starts refreshing in a background daemon thread."""
+
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name=self.__class__.__name__, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stops the background thread started by :meth:`start`."""
+
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    async def run_async(self):
+        """Refreshes forever from the running event loop, loading in its default executor."""
+
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        while True:
+            await loop.run_in_executor(None, self.refresh)
+            await asyncio.sleep(self._interval)
+
+    def start_async(self):
+        """Schedules :meth:`run_async` as a task on the current event loop and returns it."""
+
+        import asyncio
+
+        return asyncio.ensure_future(self.run_async())
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self.refresh()
+            self._wakeup.wait(self._interval)
+            self._wakeup.clear()
+
+    def _ttl_for(self, currency):
+        return self._ttls.get(currency, self._ttl)
+
+    def _is_stale(self, currency, now):
+        loaded_at = self._loaded_at.get(currency, None)
+        return loaded_at is None or now - loaded_at >= self._ttl_for(currency)
+
+    def _touch(self, currency):
+        if currency == self._snapshot.base:
+            return
+
+        if self._is_stale(currency, self._clock()) and currency not in self._wanted:
+            with self._lock:
+                self._wanted.add(currency)
+            self._wakeup.set()
+
+    def _due(self):
+        now = self._clock()
+        with self._lock:
+            candidates = set(self._wanted)
+            candidates.update(self._loaded_at)
+        return [
+            currency for currency in candidates
+            if self._is_stale(currency, now) and self._retry_at.get(currency, now) <= now
+        ]
+
+    def _load(self, currencies):
+        start = self._clock()
+        try:
+            base = self._loader.base
+            rates = self._loader.rates(currencies)
+        except Exception as e:
+            now = self._clock()
+            with self._lock:
+                self._errors += 1
+                self._last_error = e
+                for currency in currencies:
+                    failures = self._failures.get(currency, 0) + 1
+                    self._failures[currency] = failures
+                    self._retry_at[currency] = now + min(self._backoff * 2 ** (failures - 1), self._max_backoff)
+            return False
+
+        now = self._clock()
+        with self._lock:
+            loaded = {currency: rate for currency, rate in rates.items() if rate is not None}
+            if base == self._snapshot.base:
+                self._snapshot = self._snapshot.replace(rates=loaded)
+            else:
+                # Rates quoted against the previous base can't be mixed in, drop them until reloaded.
+                self._snapshot = RatesSnapshot(base, loaded)
+                for currency in set(self._loaded_at).difference(currencies):
+                    del self._loaded_at[currency]
+                    if currency != base:
+                        self._wanted.add(currency)
+            for currency in currencies:
+                self._loaded_at[currency] = now
+                self._failures.pop(currency, None)
+                self._retry_at.pop(currency, None)
+                self._wanted.discard(currency)
+
+            self._loads += 1
+            self._load_time += now - start
+            self._last_load_time = now - start
+        return True
+
+
+class _RefreshingSnapshot(BaseBackend):
+    """Snapshot of a :class:`RefreshingBackend` that reports its lookups back to the backend."""
+
+    def __init__(self, owner, snapshot):
+        self._owner = owner
+        self._snapshot = snapshot
+
+    @property
+    def base(self):
+        return self._snapshot.base
+
+    @property
+    def table(self):
+        """Returns a read-only mapping of the rates in this snapshot."""
+
+        return self._snapshot.table
+
+    def rate(self, currency):
+        self._owner._touch(currency)
+        return self._snapshot.rate(currency)
+
+    def quotation(self, origin, target):
+        self._owner._touch(origin)
+        self._owner._touch(target)
+        return self._snapshot.quotation(origin, target)
+
+    def rates(self, currencies):
+        currencies = list(currencies)
+        for currency in currencies:
+            self._owner._touch(currency)
+        return self._snapshot.rates(currencies)
+
+    def quotations(self, pairs):
+        pairs = list(pairs)
+        for origin, target in pairs:
+            self._owner._touch(origin)
+            self._owner._touch(target)
+        return self._snapshot.quotations(pairs)
+
+
+class GraphBackend(BaseBackend):
+    """
+    Backend resolving quotations through a graph of direct pair quotes.
+
+    Every quote (e.g. EUR/USD) is an edge between two currencies, with its inverse implied.
+    Arbitrary pairs are resolved through the best path for the chosen strategy and both the
+    path and the resulting quotation are memoized. Updating the rate of an existing quote
+    only invalidates the cached quotations whose path goes through it.
+
+    Parameters
+    ----------
+    strategy: str
+        ``'hops'`` picks the path with the fewest conversions, ``'fresh'`` picks the path whose
+        oldest quote is the most recent one (ties broken by fewest conversions)
+
+    Raises
+    ------
+    ValueError
+        If the given strategy isn't supported
+    """
+
+    STRATEGIES = ('hops', 'fresh')
+
+    def __init__(self, strategy='hops', clock=time.time):
+        if strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}', expected one of {self.STRATEGIES}.")
+
         self._base = None
-        self._rates = {}
+        self._strategy = strategy
+        self._clock = clock
+
+        self._lock = threading.Lock()
+        self._edges = {}
+        self._paths = {}
+        self._quotes = {}
+        self._path_dependents = {}
+        self._quote_dependents = {}
 
     @property
     def base(self):
@@ -40,13 +496,172 @@ class SimpleBackend(BaseBackend):
     def base(self, currency):
         self._base = currency
 
-    def setrate(self, currency, rate):
-        self._rates[currency] = rate
+    @property
+    def strategy(self):
+        """Returns the path selection strategy."""
+
+        return self._strategy
+
+    def setquote(self, origin, target, rate, timestamp=None):
+        """Sets the direct quote between two currencies (origin, target), implying its inverse."""
+
+        if not isinstance(rate, Decimal):
+            rate = Decimal(str(rate))
+        if timestamp is None:
+            timestamp = self._clock()
+
+        with self._lock:
+            existing = target in self._edges.get(origin, ())
+            connects = origin in self._edges and target in self._edges
+
+            self._edges.setdefault(origin, {})[target] = (rate, timestamp)
+            self._edges.setdefault(target, {})[origin] = (Decimal(1) / rate, timestamp)
+
+            if self._strategy == 'fresh' or (not existing and connects):
+                # A new shortcut or a fresher quote can change the best path of any pair.
+                self._clear()
+            elif existing:
+                self._invalidate(origin, target, paths=False)
+            else:
+                self._clear_misses()
+
+    def removequote(self, origin, target):
+        """Removes the direct quote between two currencies (origin, target)."""
+
+        with self._lock:
+            if self._edges.get(origin, {}).pop(target, None) is None:
+                return
+            self._edges[target].pop(origin, None)
+            self._invalidate(origin, target, paths=True)
+
+    def path(self, origin, target):
+        """Returns the currencies the quotation between (origin, target) goes through, or None."""
+
+        if origin == target:
+            return (origin,)
+
+        key = (origin, target)
+        if key not in self._paths:
+            self.quotation(origin, target)
+        return self._paths.get(key, None)
 
     def rate(self, currency):
-        if currency == self.base:
+        if self._base is None:
+            return None
+        return self.quotation(self._base, currency)
+
+    def rates(self, currencies):
+        return {currency: self.rate(currency) for currency in currencies}
+
+    def quotations(self, pairs):
+        return {(origin, target): self.quotation(origin, target) for origin, target in pairs}
+
+    def quotation(self, origin, target):
+        if origin == target:
             return Decimal(1)
-        return self._rates.get(currency, None)
+
+        key = (origin, target)
+        try:
+            return self._quotes[key]
+        except KeyError:
+            pass
+
+        with self._lock:
+            path = self._paths.get(key, ())
+            if path == ():
+                path = self._resolve(origin, target)
+                self._paths[key] = path
+                self._register(self._path_dependents, path, key)
+            if path is None:
+                return None
+
+            quote = Decimal(1)
+            for a, b in zip(path, path[1:]):
+                quote *= self._edges[a][b][0]
+
+            self._quotes[key] = quote
+            self._register(self._quote_dependents, path, key)
+            return quote
+
+    def _resolve(self, origin, target):
+        if origin not in self._edges or target not in self._edges:
+            return None
+        if self._strategy == 'fresh':
+            return self._resolve_fresh(origin, target)
+        return self._resolve_hops(origin, target)
+
+    def _resolve_hops(self, origin, target, oldest=None):
+        previous = {origin: None}
+        queue = deque((origin,))
+        while queue:
+            currency = queue.popleft()
+            if currency == target:
+                return self._walk(previous, target)
+            for neighbour, (_, timestamp) in self._edges[currency].items():
+                if oldest is not None and timestamp < oldest:
+                    continue
+                if neighbour not in previous:
+                    previous[neighbour] = currency
+                    queue.append(neighbour)
+        return None
+
+    def _resolve_fresh(self, origin, target):
+        # Widest path first: the best achievable oldest timestamp between origin and target.
+        best = {origin: float('inf')}
+        heap = [(float('-inf'), origin)]
+        while heap:
+            oldest, currency = heapq.heappop(heap)
+            oldest = -oldest
+            if currency == target:
+                break
+            if oldest < best[currency]:
+                continue
+            for neighbour, (_, timestamp) in self._edges[currency].items():
+                candidate = min(oldest, timestamp)
+                if candidate > best.get(neighbour, float('-inf')):
+                    best[neighbour] = candidate
+                    heapq.heappush(heap, (-candidate, neighbour))
+
+        if target not in best:
+            return None
+        # Then the fewest hops using only quotes at least that fresh.
+        return self._resolve_hops(origin, target, oldest=best[target])
+
+    @staticmethod
+    def _walk(previous, target):
+        path = []
+        while target is not None:
+            path.append(target)
+            target = previous[target]
+        return tuple(reversed(path))
+
+    @staticmethod
+    def _register(dependents, path, key):
+        if path is None:
+            return
+        for a, b in zip(path, path[1:]):
+            dependents.setdefault(frozenset((a, b)), set()).add(key)
+
+    def _invalidate(self, origin, target, paths):
+        edge = frozenset((origin, target))
+        for key in self._quote_dependents.pop(edge, ()):
+            self._quotes.pop(key, None)
+        if paths:
+            for key in self._path_dependents.pop(edge, ()):
+                self._paths.pop(key, None)
+                self._quotes.pop(key, None)
+
+    def _clear_misses(self):
+        self._paths = {key: path for key, path in self._paths.items() if path is not None}
+
+    def _clear(self):
+        self._paths = {}
+        self._quotes = {}
+        self._path_dependents = {}
+        self._quote_dependents = {}
+
+
+_scope = ContextVar('money_xrates_scope', default=None)
 
 
 class ExchangeRates:
@@ -88,6 +703,44 @@ class ExchangeRates:
 
         self._backend = backend
 
+    def scoped_backend(self):
+        """Returns the backend pinned by the innermost :meth:`snapshot_scope`, or the current backend."""
+
+        pinned = _scope.get()
+        if pinned is not None:
+            return pinned
+        return self._backend
+
+    @contextmanager
+    def snapshot_scope(self):
+        """
+        Pins the rates of the current backend for every conversion made in the block.
+
+        Conversions by ``Money.to`` and by the arithmetic and comparison operators all use
+        the same snapshot (or the backend itself if it doesn't provide snapshots), so a
+        batch never mixes rates from before and after a refresh. Nested scopes reuse the
+        rates pinned by the outermost one. The scope is tracked with a context variable and
+        therefore local to the current thread or asyncio task.
+
+        Raises
+        ------
+        ExchangeBackendNotSet
+            If no backend has been set
+        """
+
+        backend = self._backend
+        if backend is None:
+            raise ExchangeBackendNotSet()
+
+        pinned = _scope.get()
+        if pinned is None:
+            pinned = backend.snapshot() if hasattr(backend, 'snapshot') else backend
+        token = _scope.set(pinned)
+        try:
+            yield pinned
+        finally:
+            _scope.reset(token)
+
     def __getattr__(self, item):
         if self._backend is None:
             raise ExchangeBackendNotSet()
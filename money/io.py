@@ -0,0 +1,255 @@
+"""
+Streaming readers and writers for ledger files of (amount, currency) records.
+
+Every reader and writer works in bounded chunks, so memory stays flat regardless of the
+file size. Readers yield either :class:`MoneyArray` runs (consecutive records sharing a
+currency, at most ``chunk_size`` long) or lazily built :class:`Money` objects.
+
+Amounts are never rounded: each run is stored with the smallest exponent (at least the
+currency precision) that holds all of its amounts exactly. A run is split wherever the next
+amount would push the others out of 64-bit integers, and a ValueError is raised only for an
+amount that doesn't fit on its own, or whose exponent doesn't fit in the binary format.
+
+The binary format is a header (``MAGIC`` followed by a version byte) and a sequence of
+little-endian blocks, each starting with a one byte tag:
+
+- ``C`` defines a currency: uint16 index, 3 byte ISO 4217 code, int8 exponent
+- ``R`` holds records: uint16 currency index, uint32 count, then ``count`` int64 amounts
+  in minor units of the currency exponent
+"""
+
+import csv
+import struct
+import sys
+from array import array
+from decimal import Decimal
+from itertools import groupby, islice
+
+from money.array import MoneyArray
+from money.currency import Currency
+from money.money import Money
+
+DEFAULT_CHUNK_SIZE = 65536
+
+MAGIC = b'MNYR'
+VERSION = 1
+
+_HEADER = struct.Struct('<4sB')
+_CURRENCY = struct.Struct('<H3sb')
+_RECORDS = struct.Struct('<HI')
+
+_INT64_MIN = -2 ** 63
+_INT64_MAX = 2 ** 63 - 1
+
+
+class _Currencies(dict):
+    """Dictionary encoding of currency codes to Currency objects."""
+
+    def __missing__(self, code):
+        currency = self[code] = Currency(code)
+        return currency
+
+
+def read_csv(fp, chunk_size=DEFAULT_CHUNK_SIZE, as_array=True, header=False):
+    """
+    Reads (amount, currency) rows from a CSV file object.
+
+    Yields MoneyArray runs if ``as_array`` is True, otherwise one Money object per row.
+    Both hold the exact amounts of the file. Blank lines are skipped.
+
+    Raises
+    ------
+    ValueError
+        If a row isn't a valid (amount, currency) pair, reporting its line number
+    """
+
+    reader = csv.reader(fp)
+    if header:
+        next(reader, None)
+
+    rows = _parse_csv(reader)
+    if as_array:
+        return _read_csv_arrays(rows, chunk_size)
+    return _read_csv_money(rows)
+
+
+def write_csv(fp, values, chunk_size=DEFAULT_CHUNK_SIZE, header=False):
+    """Writes Money objects and/or MoneyArray columns as (amount, currency) rows to a CSV file object."""
+
+    writer = csv.writer(fp)
+    if header:
+        writer.writerow(('amount', 'currency'))
+
+    rows = _csv_rows(values)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        writer.writerows(chunk)
+
+
+def read_binary(fp, as_array=True):
+    """
+    Reads money records from a binary file object.
+
+    Yields one MoneyArray per records block if ``as_array`` is True, otherwise one
+    Money object per record.
+
+    Raises
+    ------
+    ValueError
+        If the file isn't a money records file or is truncated
+    """
+
+    magic, version = _HEADER.unpack(_read_exactly(fp, _HEADER.size))
+    if magic != MAGIC or version != VERSION:
+        raise ValueError('Not a money records file.')
+
+    arrays = _read_binary_arrays(fp)
+    if as_array:
+        return arrays
+    return (value for column in arrays for value in column)
+
+
+def write_binary(fp, values, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes Money objects and/or MoneyArray columns as money records to a binary file object.
+
+    Money amounts are stored exactly, in minor units of an exponent chosen per run.
+    """
+
+    fp.write(_HEADER.pack(MAGIC, VERSION))
+
+    indexes = {}
+    for column in _runs(values, chunk_size):
+        key = (column.currency.code, column.exponent)
+        index = indexes.get(key, None)
+        if index is None:
+            if not -128 <= key[1] <= 127:
+                raise ValueError(f"Exponent {key[1]} of {key[0]} amounts doesn't fit in a money records file.")
+            index = indexes[key] = len(indexes)
+            fp.write(b'C' + _CURRENCY.pack(index, key[0].encode('ascii'), key[1]))
+
+        data = column.data
+        if sys.byteorder != 'little':
+            data = array('q', data)
+            data.byteswap()
+
+        fp.write(b'R' + _RECORDS.pack(index, len(column)))
+        fp.write(data)
+
+
+def _parse_csv(reader):
+    currencies = _Currencies()
+    for row in reader:
+        if not row:
+            continue
+        try:
+            amount, code = row
+            yield Decimal(amount), currencies[code]
+        except (ValueError, ArithmeticError):
+            raise ValueError(f"Malformed money record on line {reader.line_num}: {row!r}.") from None
+
+
+def _read_csv_arrays(rows, chunk_size):
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        for currency, run in groupby(chunk, key=lambda row: row[1]):
+            yield from _exact_runs([amount for amount, _ in run], currency)
+
+
+def _read_csv_money(rows):
+    for amount, currency in rows:
+        yield Money(amount, currency)
+
+
+def _csv_rows(values):
+    for value in values:
+        if isinstance(value, MoneyArray):
+            code, exponent = value.currency.code, -value.exponent
+            for amount in value.data:
+                yield str(Decimal(amount).scaleb(exponent)), code
+        else:
+            yield Decimal.__str__(value), value.currency.code
+
+
+def _read_binary_arrays(fp):
+    currencies = {}
+    while True:
+        tag = fp.read(1)
+        if not tag:
+            break
+
+        if tag == b'C':
+            index, code, exponent = _CURRENCY.unpack(_read_exactly(fp, _CURRENCY.size))
+            try:
+                currencies[index] = (Currency(code.decode('ascii')), exponent)
+            except UnicodeDecodeError:
+                raise ValueError(f"Invalid currency code {code!r} in money records file.") from None
+        elif tag == b'R':
+            index, count = _RECORDS.unpack(_read_exactly(fp, _RECORDS.size))
+            if index not in currencies:
+                raise ValueError(f"Records block refers to undefined currency index {index}.")
+            currency, exponent = currencies[index]
+
+            data = _read_exactly(fp, count * 8)
+            if sys.byteorder != 'little':
+                data = array('q', data)
+                data.byteswap()
+
+            yield MoneyArray(data, currency, exponent)
+        else:
+            raise ValueError(f"Unknown block tag {tag!r} in money records file.")
+
+
+def _runs(values, chunk_size):
+    pending, currency = [], None
+    for value in values:
+        if isinstance(value, MoneyArray):
+            if pending:
+                yield from _exact_runs(pending, currency)
+                pending = []
+            for start in range(0, len(value), chunk_size):
+                yield value[start:start + chunk_size]
+            continue
+
+        if pending and (value.currency != currency or len(pending) >= chunk_size):
+            yield from _exact_runs(pending, currency)
+            pending = []
+        pending.append(value)
+        currency = value.currency
+
+    if pending:
+        yield from _exact_runs(pending, currency)
+
+
+def _exact_runs(amounts, currency):
+    """Yields exact MoneyArray runs of the amounts, split where a shared exponent would overflow int64."""
+
+    precision = currency.precision
+    start, exponent, low, high = 0, precision, None, None
+    for i, amount in enumerate(amounts):
+        amount = Decimal(amount)
+        amount_exponent = amount.as_tuple().exponent
+        if not isinstance(amount_exponent, int):
+            raise ValueError(f"Amount '{amount}' isn't finite.")
+
+        wider = max(exponent, -amount_exponent)
+        lower = amount if low is None else min(low, amount)
+        higher = amount if high is None else max(high, amount)
+        if i > start and (lower.scaleb(wider) < _INT64_MIN or higher.scaleb(wider) > _INT64_MAX):
+            yield MoneyArray.from_decimals(amounts[start:i], currency, exponent, exact=True)
+            start, wider, lower, higher = i, max(precision, -amount_exponent), amount, amount
+        exponent, low, high = wider, lower, higher
+
+    if start < len(amounts):
+        yield MoneyArray.from_decimals(amounts[start:], currency, exponent, exact=True)
+
+
+def _read_exactly(fp, size):
+    data = fp.read(size)
+    if len(data) != size:
+        raise ValueError('Truncated money records file.')
+    return data
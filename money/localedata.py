@@ -0,0 +1,110 @@
+class LocaleData:
+    """
+    Table of currency symbols and display names per (currency, locale) pair.
+
+    Lookups are answered from the table, misses are resolved through Babel once and
+    memoized. The table can be built eagerly for the currencies and locales in use,
+    saved to a file and loaded back so requests never have to call Babel.
+    """
+
+    VERSION = 1
+
+    def __init__(self):
+        self._entries = {}
+
+    def build(self, currencies, locales):
+        """Eagerly resolves the symbol and name of every currency for every locale."""
+
+        from babel.numbers import get_currency_name, get_currency_symbol
+
+        currencies = [str(currency) for currency in currencies]
+        for locale in locales:
+            locale = str(locale)
+            for code in currencies:
+                self._entries[(code, locale)] = (
+                    get_currency_symbol(code, locale=locale),
+                    get_currency_name(code, locale=locale),
+                )
+
+    def symbol(self, code, locale='en_US'):
+        """Returns the symbol used by the locale for a currency code."""
+
+        return self._lookup(code, locale)[0]
+
+    def display_name(self, code, locale='en_US'):
+        """Returns the name used by the locale for a currency code."""
+
+        return self._lookup(code, locale)[1]
+
+    def save(self, fp):
+        """Writes the table as JSON to a text file object."""
+
+        import json
+
+        data = {}
+        for (code, locale), entry in sorted(self._entries.items()):
+            data.setdefault(locale, {})[code] = list(entry)
+        json.dump({'version': self.VERSION, 'locales': data}, fp, ensure_ascii=False, separators=(',', ':'))
+
+    def load(self, fp):
+        """
+        Merges a table written by :meth:`save` from a text file object.
+
+        Raises
+        ------
+        ValueError
+            If the file isn't a supported locale data table
+        """
+
+        import json
+
+        data = json.load(fp)
+        if not isinstance(data, dict) or data.get('version') != self.VERSION:
+            raise ValueError('Not a supported locale data file.')
+
+        locales = data.get('locales', None)
+        if not isinstance(locales, dict):
+            raise ValueError('Not a supported locale data file.')
+
+        loaded = {}
+        for locale, entries in locales.items():
+            if not isinstance(entries, dict):
+                raise ValueError('Not a supported locale data file.')
+            for code, entry in entries.items():
+                if not isinstance(entry, list) or len(entry) != 2 or not all(isinstance(v, str) for v in entry):
+                    raise ValueError('Not a supported locale data file.')
+                loaded[(code, locale)] = tuple(entry)
+        self._entries.update(loaded)
+
+    def clear(self):
+        """Removes every entry from the table."""
+
+        self._entries = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        code, locale = key
+        return (str(code), str(locale)) in self._entries
+
+    def _lookup(self, code, locale):
+        if not isinstance(locale, str):
+            locale = str(locale)
+
+        key = (code, locale)
+        try:
+            return self._entries[key]
+        except KeyError:
+            pass
+
+        from babel.numbers import get_currency_name, get_currency_symbol
+
+        entry = self._entries[key] = (
+            get_currency_symbol(code, locale=locale),
+            get_currency_name(code, locale=locale),
+        )
+        return entry
+
+
+locale_data = LocaleData()
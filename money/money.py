@@ -1,7 +1,5 @@
 from decimal import Decimal, ROUND_HALF_UP
 
-from babel.numbers import format_currency
-
 from money import Currency, xrates
 from money.exceptions import ExchangeBackendNotSet, ExchangeRateNotFound
 
@@ -48,7 +46,7 @@ class Money(Decimal):
 
     _rounding_mode = ROUND_HALF_UP
 
-    __slots__ = ('_currency',)
+    __slots__ = ('_currency', '_hash')
 
     def __new__(cls, amount, currency):
         self = super().__new__(cls, amount)
@@ -57,6 +55,7 @@ class Money(Decimal):
             currency = Currency(str(currency))
 
         self._currency = currency
+        self._hash = None
 
         return self
 
@@ -87,19 +86,18 @@ class Money(Decimal):
         return self.__class__, (Decimal.__str__(self), self._currency)
 
     def __eq__(self, other):
-        result = super().__eq__(other)
-        if result is NotImplemented:
-            return NotImplemented
-
         if isinstance(other, Money):
-            return result and other._currency == self._currency
-        return result
+            return other._currency == self._currency and Decimal.__eq__(self, other)
+        return Decimal.__eq__(self, other)
 
     def __ne__(self, other):
         return not self == other
 
     def __hash__(self):
-        return hash((Decimal(self), self._currency.code))
+        result = self._hash
+        if result is None:
+            self._hash = result = hash((Decimal.__hash__(self), self._currency.code))
+        return result
 
     __lt__ = _make_comparison_operator('__lt__')
     __le__ = _make_comparison_operator('__le__')
@@ -130,29 +128,53 @@ class Money(Decimal):
     __floor__ = _make_class_operator('__floor__')
     __ceil__ = _make_class_operator('__ceil__')
 
-    def to(self, currency):
-        """Returns the equivalent money object in another currency."""
+    def to(self, currency, backend=None):
+        """
+        Returns the equivalent money object in another currency.
+
+        A specific backend (e.g. a snapshot captured once for a whole batch) can be
+        given, otherwise the backend pinned by ``xrates.snapshot_scope()`` or the current
+        ``xrates`` backend is used.
+        """
 
         if currency == self._currency:
             return self
 
-        if xrates.backend is None:
-            raise ExchangeBackendNotSet()
+        if backend is None:
+            backend = xrates.scoped_backend()
+            if backend is None:
+                raise ExchangeBackendNotSet()
+            backend_name = xrates.backend_name
+        else:
+            backend_name = backend.__class__.__name__
 
         if not isinstance(currency, Currency):
             currency = Currency(str(currency))
 
-        rate = xrates.backend.quotation(self._currency.code, currency.code)
+        rate = backend.quotation(self._currency.code, currency.code)
         if rate is None:
-            raise ExchangeRateNotFound(xrates.backend_name, self._currency, currency)
+            raise ExchangeRateNotFound(backend_name, self._currency, currency)
 
         return self.__class__(self * rate, currency)
 
     def format(self, locale='en_US'):
         """Returns a string of the currency formatted for the specified locale."""
 
+        from babel.numbers import format_currency
         return format_currency(self, self.currency.code, locale=locale).replace('\xa0', ' ')
 
+    @classmethod
+    def from_buffer(cls, buf, currency, exponent=None):
+        """
+        Returns a MoneyArray wrapping a buffer of 64-bit minor unit amounts without copying.
+
+        The exponent is the number of decimal places of the amounts and defaults to the
+        currency precision.
+        """
+
+        from money.array import MoneyArray
+        return MoneyArray(buf, currency, exponent)
+
     @classmethod
     def set_rounding_mode(cls, mode):
         cls._rounding_mode = mode
@@ -0,0 +1,178 @@
+import functools
+import threading
+from contextlib import contextmanager
+from time import perf_counter
+
+from money.money import Money
+
+_OPERATORS = (
+    '__lt__', '__le__', '__gt__', '__ge__',
+    '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__', '__truediv__', '__rtruediv__',
+    '__divmod__', '__rdivmod__', '__mod__', '__rmod__', '__floordiv__', '__rfloordiv__', '__pow__', '__rpow__',
+)
+
+_lock = threading.Lock()
+_active = []
+_originals = {}
+
+
+class Profile:
+    """
+    Call counts and accumulated wall time of Money operations, collected by :func:`profile`.
+
+    Times are inclusive: a conversion made by an arithmetic operator is counted both
+    under ``to`` and under the operator.
+    """
+
+    def __init__(self):
+        self._stats = {}
+
+    def record(self, operation, origin, target, elapsed):
+        """Adds one call of an operation between two currency codes."""
+
+        stats = self._stats.get((operation, origin, target), None)
+        if stats is None:
+            stats = self._stats[(operation, origin, target)] = [0, 0.0]
+        stats[0] += 1
+        stats[1] += elapsed
+
+    def operations(self):
+        """Returns a dict of operation names to (calls, seconds) totals over every currency pair."""
+
+        totals = {}
+        for (operation, _, _), (calls, elapsed) in self._stats.items():
+            current = totals.get(operation, (0, 0.0))
+            totals[operation] = (current[0] + calls, current[1] + elapsed)
+        return totals
+
+    def as_dict(self):
+        """Returns the collected statistics as JSON serializable data."""
+
+        return {
+            'operations': {
+                operation: {'calls': calls, 'time': elapsed}
+                for operation, (calls, elapsed) in self.operations().items()
+            },
+            'pairs': [
+                {'operation': operation, 'origin': origin, 'target': target, 'calls': calls, 'time': elapsed}
+                for (operation, origin, target), (calls, elapsed) in self._sorted()
+            ],
+        }
+
+    def dump(self, fp):
+        """Writes :meth:`as_dict` as JSON to a text file object."""
+
+        import json
+
+        json.dump(self.as_dict(), fp)
+
+    def summary(self):
+        """Returns a table of every operation and currency pair, slowest first."""
+
+        lines = [f"{'operation':<12} {'origin':<6} {'target':<6} {'calls':>10} {'total ms':>12} {'mean us':>10}"]
+        for (operation, origin, target), (calls, elapsed) in self._sorted():
+            lines.append(
+                f"{operation:<12} {origin:<6} {target:<6} {calls:>10} {elapsed * 1e3:>12.3f} {elapsed / calls * 1e6:>10.3f}"
+            )
+        return '\n'.join(lines)
+
+    def _sorted(self):
+        return sorted(self._stats.items(), key=lambda item: item[1][1], reverse=True)
+
+
+@contextmanager
+def profile():
+    """
+    Profiles Money operations for the duration of the block.
+
+    Operators, conversions (``to``), rounding (``amount``) and formatting (``format``)
+    are instrumented while at least one profile is active and restored afterwards, so
+    there is no overhead outside of it. Calls from every thread are recorded.
+
+    >>> with profile() as p:
+    ...     report()
+    >>> print(p.summary())
+    """
+
+    result = Profile()
+    with _lock:
+        if not _active:
+            _install()
+        _active.append(result)
+
+    try:
+        yield result
+    finally:
+        with _lock:
+            _active.remove(result)
+            if not _active:
+                _uninstall()
+
+
+def _record(operation, origin, target, elapsed):
+    with _lock:
+        for active in _active:
+            active.record(operation, origin, target, elapsed)
+
+
+def _wrap_operator(name, method):
+    operation = name.strip('_')
+
+    @functools.wraps(method)
+    def wrapper(self, other, *args):
+        start = perf_counter()
+        try:
+            return method(self, other, *args)
+        finally:
+            elapsed = perf_counter() - start
+            origin = self._currency.code
+            target = other._currency.code if isinstance(other, Money) else origin
+            _record(operation, origin, target, elapsed)
+
+    return wrapper
+
+
+def _wrap_to(method):
+    @functools.wraps(method)
+    def wrapper(self, currency, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return method(self, currency, *args, **kwargs)
+        finally:
+            _record('to', self._currency.code, str(currency), perf_counter() - start)
+
+    return wrapper
+
+
+def _wrap_unary(operation, method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        start = perf_counter()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            code = self._currency.code
+            _record(operation, code, code, perf_counter() - start)
+
+    return wrapper
+
+
+def _install():
+    for name in _OPERATORS:
+        _originals[name] = Money.__dict__[name]
+        setattr(Money, name, _wrap_operator(name, _originals[name]))
+
+    _originals['to'] = Money.__dict__['to']
+    Money.to = _wrap_to(_originals['to'])
+
+    _originals['format'] = Money.__dict__['format']
+    Money.format = _wrap_unary('format', _originals['format'])
+
+    _originals['amount'] = Money.__dict__['amount']
+    Money.amount = property(_wrap_unary('amount', _originals['amount'].fget), doc=_originals['amount'].__doc__)
+
+
+def _uninstall():
+    for name, method in _originals.items():
+        setattr(Money, name, method)
+    _originals.clear()
@@ -0,0 +1,141 @@
+import builtins
+from decimal import Decimal
+
+from money.currency import Currency
+from money.exceptions import ExchangeBackendNotSet, ExchangeRateNotFound
+from money.exchange import xrates
+from money.money import Money
+
+
+def key_for(currency, backend=None, currencies=None):
+    """
+    Returns a key function mapping money objects to plain decimals in a single currency.
+
+    Every source currency is quoted once per key function instead of once per comparison,
+    so ``sorted(values, key=key_for('USD'))`` makes one backend call per distinct currency.
+    If the backend provides snapshots, one is captured for the lifetime of the key function.
+
+    Parameters
+    ----------
+    currency: Currency or str
+        The currency values are normalized to
+    backend: BaseBackend
+        The backend used for quotations, defaults to the ``xrates`` backend (or the
+        snapshot pinned by :meth:`~money.exchange.ExchangeRates.snapshot_scope`)
+    currencies: iterable
+        Source currencies known upfront, quoted with a single ``quotations`` call
+    """
+
+    if not isinstance(currency, Currency):
+        currency = Currency(str(currency))
+
+    if backend is None:
+        backend = xrates.scoped_backend()
+        name = xrates.backend_name if backend is not None else None
+    else:
+        name = backend.__class__.__name__
+    if hasattr(backend, 'snapshot'):
+        backend = backend.snapshot()
+
+    rates = {currency: None}
+    if currencies is not None:
+        rates.update(_quotations(backend, name, currencies, currency))
+
+    def key(value):
+        source = value.currency
+        try:
+            rate = rates[source]
+        except KeyError:
+            rate = rates[source] = _quotation(backend, name, source, currency)
+
+        if rate is None:
+            return Decimal(value)
+        return Decimal.__mul__(value, rate)
+
+    return key
+
+
+def sort(values, in_currency=None, reverse=False, backend=None):
+    """
+    Returns a new list of money objects sorted by their value in a single currency.
+
+    Each value is converted once into a normalized key. ``in_currency`` defaults to the
+    currency of the first value, matching how comparison operators convert.
+    """
+
+    values = list(values)
+    if not values:
+        return values
+
+    return sorted(values, key=_key(values, in_currency, backend), reverse=reverse)
+
+
+def max(values, in_currency=None, backend=None):
+    """Returns the largest money object, converting each value once (see :func:`sort`)."""
+
+    values = list(values)
+    if not values:
+        raise ValueError('max() arg is an empty sequence')
+
+    return builtins.max(values, key=_key(values, in_currency, backend))
+
+
+def min(values, in_currency=None, backend=None):
+    """Returns the smallest money object, converting each value once (see :func:`sort`)."""
+
+    values = list(values)
+    if not values:
+        raise ValueError('min() arg is an empty sequence')
+
+    return builtins.min(values, key=_key(values, in_currency, backend))
+
+
+def sum(values, in_currency=None, backend=None):
+    """
+    Returns the total of money objects in a single currency, converting each value once.
+
+    ``in_currency`` defaults to the currency of the first value, matching how addition
+    converts, and is required for an empty sequence.
+    """
+
+    values = list(values)
+    if in_currency is None:
+        if not values:
+            raise ValueError('sum() of an empty sequence requires in_currency')
+        in_currency = values[0].currency
+
+    key = _key(values, in_currency, backend)
+    return Money(builtins.sum(map(key, values), Decimal(0)), in_currency)
+
+
+def _key(values, in_currency, backend):
+    currencies = {value.currency for value in values}
+    return key_for(in_currency or values[0].currency, backend, currencies)
+
+
+def _quotations(backend, name, currencies, target):
+    pairs = [(code, target.code) for code in {str(currency) for currency in currencies} if code != target.code]
+    if not pairs:
+        return {}
+    if backend is None:
+        raise ExchangeBackendNotSet()
+
+    quotations = backend.quotations(pairs)
+
+    rates = {}
+    for origin, _ in pairs:
+        rate = quotations.get((origin, target.code), None)
+        if rate is None:
+            raise ExchangeRateNotFound(name, origin, target)
+        rates[Currency(origin)] = rate
+    return rates
+
+
+def _quotation(backend, name, origin, target):
+    if backend is None:
+        raise ExchangeBackendNotSet()
+
+    rate = backend.quotation(origin.code, target.code)
+    if rate is None:
+        raise ExchangeRateNotFound(name, origin, target)
+    return rate
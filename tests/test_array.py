@@ -0,0 +1,120 @@
+import pickle
+from array import array
+from decimal import Decimal, ROUND_DOWN, ROUND_HALF_UP
+
+import pytest
+
+from money import Currency, Money, MoneyArray, xrates
+
+
+def test_construction():
+    column = MoneyArray([100, 250], 'USD')
+
+    assert len(column) == 2
+    assert column.currency == Currency('USD')
+    assert column.exponent == 2
+    assert list(column) == [Money('1', 'USD'), Money('2.5', 'USD')]
+
+    column = MoneyArray([100, 250], 'USD', exponent=4)
+
+    assert list(column) == [Money('0.01', 'USD'), Money('0.025', 'USD')]
+
+    column = MoneyArray(bytes(16), 'JPY')
+
+    assert list(column) == [Money(0, 'JPY'), Money(0, 'JPY')]
+
+    with pytest.raises(ValueError):
+        MoneyArray(array('i', [1, 2]), 'USD')
+
+    with pytest.raises(ValueError):
+        MoneyArray(bytes(12), 'USD')
+
+
+def test_from_decimals():
+    column = MoneyArray.from_decimals(['1.005', Decimal('2'), 3], 'USD')
+
+    assert column.data.tolist() == [101, 200, 300]
+
+    Money.set_rounding_mode(ROUND_DOWN)
+    try:
+        assert MoneyArray.from_decimals(['1.005'], 'USD').data.tolist() == [100]
+    finally:
+        Money.set_rounding_mode(ROUND_HALF_UP)
+
+    with pytest.raises(ValueError):
+        MoneyArray.from_decimals(['1E+20'], 'USD')
+
+
+def test_from_decimals_exact():
+    column = MoneyArray.from_decimals(['1.23456', '2', Decimal('3.5')], 'USD', exact=True)
+
+    assert column.exponent == 5
+    assert column.data.tolist() == [123456, 200000, 350000]
+
+    assert MoneyArray.from_decimals(['7'], 'JPY', exact=True).exponent == 0
+
+    with pytest.raises(ValueError):
+        MoneyArray.from_decimals(['1.005'], 'USD', exponent=2, exact=True)
+
+    with pytest.raises(ValueError):
+        MoneyArray.from_decimals(['NaN'], 'USD', exact=True)
+
+    with pytest.raises(ValueError):
+        MoneyArray.from_decimals(['1E+20'], 'USD', exact=True)
+
+
+def test_from_money():
+    column = MoneyArray.from_money([Money('1.234', 'JPY'), Money('7', 'JPY')])
+
+    assert column.currency == 'JPY'
+    assert column.data.tolist() == [1, 7]
+
+    with pytest.raises(ValueError):
+        MoneyArray.from_money([])
+
+    xrates.backend = 'money.exchange.SimpleBackend'
+    xrates.base = 'USD'
+    xrates.setrate('EUR', Decimal(2))
+    try:
+        column = MoneyArray.from_money([Money(1, 'USD'), Money(4, 'EUR')])
+    finally:
+        xrates.backend = None
+
+    assert column.data.tolist() == [100, 200]
+
+
+def test_from_buffer_zero_copy():
+    buffer = array('q', [100, 250])
+    column = Money.from_buffer(buffer, 'USD')
+
+    buffer[0] = 5
+
+    assert column[0] == Money('0.05', 'USD')
+    assert memoryview(column.data).obj is buffer
+    assert array('q', column.data.tobytes()) == buffer
+
+
+def test_getitem():
+    column = MoneyArray([100, 250, 300], 'USD')
+
+    assert column[1] == Money('2.5', 'USD')
+    assert column[-1] == Money('3', 'USD')
+    assert list(column[1:]) == [Money('2.5', 'USD'), Money('3', 'USD')]
+    assert column[1:].data.obj is column.data.obj
+
+
+def test_sum():
+    assert MoneyArray([100, 250, 300], 'USD').sum() == Money('6.5', 'USD')
+    assert MoneyArray([], 'USD').sum() == Money(0, 'USD')
+
+
+def test_repr():
+    assert repr(MoneyArray([100], 'USD')) == 'MoneyArray([100], Currency(\'USD\'), exponent=2)'
+
+
+def test_reduce():
+    column = pickle.loads(pickle.dumps(MoneyArray([100, 250], 'USD', exponent=3)))
+
+    assert column.data.tolist() == [100, 250]
+    assert column.currency == 'USD'
+    assert column.exponent == 3
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from money import Currency
@@ -60,6 +62,18 @@ def test_eq():
     assert not Currency('USD') == 10
 
 
+def test_hash():
+    assert hash(Currency('USD')) == hash(Currency('USD'))
+    assert hash(Currency('USD')) == hash('USD')
+    assert {Currency('USD'): 1}['USD'] == 1
+    assert len({Currency('USD'), Currency('USD'), Currency('JPY')}) == 2
+
+
+def test_interned():
+    assert Currency('USD') is Currency('USD')
+    assert pickle.loads(pickle.dumps(Currency('USD'))) is Currency('USD')
+
+
 def test_ne():
     assert Currency('USD') != Currency('JPY')
     assert Currency('USD') != 'JPY'
@@ -0,0 +1,70 @@
+from decimal import Decimal
+
+import pytest
+
+from benchmarks.equivalence import CASES, RATE_SETS, Case, random_amount, random_money, report, run, run_case
+from money import Money
+
+
+@pytest.mark.parametrize('rates', RATE_SETS)
+@pytest.mark.parametrize('case', CASES, ids=lambda case: case.name)
+def test_fast_paths_match_reference(case, rates):
+    result = run_case(case, runs=200, rates=rates)
+
+    assert result.divergences == [], report([result])
+    if case.tolerance is None:
+        assert result.tolerated == []
+
+
+def test_reports_divergences():
+    case = Case(
+        'truncating amount',
+        lambda rng: (random_amount(rng), 'USD'),
+        lambda inputs: [Money(amount, code).amount for amount, code in inputs],
+        lambda inputs: [Decimal(amount).quantize(Decimal('0.01'), rounding='ROUND_DOWN') for amount, _ in inputs],
+    )
+
+    results = run([case], runs=200)
+
+    assert results[0].divergences
+    assert 'truncating amount' in report(results).splitlines()[-1]
+
+
+def test_compares_exactly():
+    case = Case(
+        'unquantized amount',
+        lambda rng: (random_amount(rng), 'USD'),
+        lambda inputs: [Money(amount, code).amount for amount, code in inputs],
+        lambda inputs: [Money(amount, code).amount.normalize() for amount, code in inputs],
+    )
+
+    result = run_case(case, runs=200)
+
+    assert result.divergences
+    assert all(expected == actual for _, expected, actual in result.divergences)
+
+
+def test_reports_tolerated_divergences():
+    case = Case(
+        'nudged amount',
+        lambda rng: (random_amount(rng), 'USD'),
+        lambda inputs: [Decimal(amount) for amount, _ in inputs],
+        lambda inputs: [Decimal(amount) * Decimal('1.0000000001') for amount, _ in inputs],
+        tolerance=Decimal('1E-9'),
+    )
+
+    result = run_case(case, runs=200)
+
+    assert result.divergences == []
+    assert result.tolerated
+
+
+def test_reference_only_case_is_a_hook_for_fast_engines():
+    reference = Case('doubled', random_money, lambda inputs: [value * 2 for value in inputs])
+    plugged = Case('doubled', random_money, reference.reference, lambda inputs: [value + value for value in inputs])
+
+    smoke, result = run_case(reference, runs=200), run_case(plugged, runs=200)
+
+    assert smoke.divergences == [] and smoke.speedup is None
+    assert result.divergences == [] and result.speedup is not None
+    assert report([smoke]).splitlines()[1].endswith('-')
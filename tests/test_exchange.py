@@ -1,10 +1,13 @@
+import asyncio
+import time
 from decimal import Decimal
 
 import pytest
 
+import money
 from money import Money, xrates
 from money.exceptions import ExchangeBackendNotSet, ExchangeRateNotFound, InvalidExchangeBackend
-from money.exchange import SimpleBackend
+from money.exchange import BaseBackend, GraphBackend, RatesSnapshot, RefreshingBackend, SimpleBackend
 
 
 class TestExchange:
@@ -54,6 +57,10 @@ class TestExchange:
         with pytest.raises(ExchangeBackendNotSet):
             Money('4', 'USD').to('JPY')
 
+        with pytest.raises(ExchangeBackendNotSet):
+            with xrates.snapshot_scope():
+                pass
+
 
 class TestSimpleBackend:
     @classmethod
@@ -70,6 +77,12 @@ class TestSimpleBackend:
     def test_base(self):
         assert xrates.base == 'USD'
 
+        try:
+            xrates.base = None
+            assert xrates.base is None
+        finally:
+            xrates.base = 'USD'
+
     def test_rate(self):
         assert xrates.rate('USD') == 1
         assert xrates.rate('EUR') == 2
@@ -87,6 +100,16 @@ class TestSimpleBackend:
         assert xrates.quotation('JPY', 'EUR') == 0.25
         assert xrates.quotation('JPY', 'JPY') == 1
 
+    def test_rates(self):
+        assert xrates.rates(['USD', 'EUR', 'AUD']) == {'USD': 1, 'EUR': 2, 'AUD': None}
+
+    def test_quotations(self):
+        assert xrates.quotations([('EUR', 'JPY'), ('JPY', 'USD'), ('EUR', 'AUD')]) == {
+            ('EUR', 'JPY'): 4,
+            ('JPY', 'USD'): Decimal('0.125'),
+            ('EUR', 'AUD'): None,
+        }
+
     def test_conversion(self):
         money = Money('4', 'USD').to('EUR')
 
@@ -100,3 +123,422 @@ class TestSimpleBackend:
 
         with pytest.raises(ExchangeRateNotFound):
             Money('4', 'EUR').to('GBP')
+
+    def test_snapshot_scope(self):
+        a = Money('4', 'USD')
+        b = Money('2', 'EUR')
+
+        try:
+            with xrates.snapshot_scope() as snapshot:
+                xrates.setrate('EUR', Decimal(4))
+
+                assert xrates.scoped_backend() is snapshot
+                assert a + b == Money('5', 'USD')
+                assert a < Money('9', 'EUR')
+                assert b.to('USD') == Money('1', 'USD')
+
+                with xrates.snapshot_scope() as nested:
+                    assert nested is snapshot
+                    assert b.to('USD') == Money('1', 'USD')
+
+                assert xrates.scoped_backend() is snapshot
+
+            assert xrates.scoped_backend() is xrates.backend
+            assert a + b == Money('4.5', 'USD')
+        finally:
+            xrates.setrate('EUR', Decimal(2))
+
+    def test_conversion_with_backend(self):
+        snapshot = xrates.snapshot()
+
+        money = Money('4', 'USD').to('EUR', snapshot)
+
+        assert money.amount == 8
+        assert money.currency == 'EUR'
+
+
+class TestBaseBackend:
+    class Backend(BaseBackend):
+        base = 'USD'
+
+        def __init__(self):
+            self.calls = []
+
+        def rate(self, currency):
+            self.calls.append(currency)
+            return {'USD': Decimal(1), 'EUR': Decimal(2), 'JPY': Decimal(8)}.get(currency, None)
+
+    def test_rates(self):
+        backend = self.Backend()
+
+        assert backend.rates(['EUR', 'AUD']) == {'EUR': 2, 'AUD': None}
+
+    def test_quotations(self):
+        backend = self.Backend()
+
+        assert backend.quotations([('EUR', 'JPY'), ('JPY', 'EUR'), ('EUR', 'AUD')]) == {
+            ('EUR', 'JPY'): 4,
+            ('JPY', 'EUR'): Decimal('0.25'),
+            ('EUR', 'AUD'): None,
+        }
+        assert sorted(backend.calls) == ['AUD', 'EUR', 'JPY']
+
+    def test_quotations_with_overridden_quotation(self):
+        class Direct(BaseBackend):
+            base = 'USD'
+
+            def rate(self, currency):
+                return None
+
+            def quotation(self, origin, target):
+                return {('EUR', 'USD'): Decimal(2)}.get((origin, target), None)
+
+        backend = Direct()
+
+        assert backend.quotations([('EUR', 'USD'), ('USD', 'EUR')]) == {('EUR', 'USD'): 2, ('USD', 'EUR'): None}
+        assert money.sum([Money(1, 'USD'), Money(1, 'EUR')], backend=backend) == Money(3, 'USD')
+
+
+class TestRatesSnapshot:
+    def test_rate(self):
+        snapshot = RatesSnapshot('USD', {'EUR': Decimal(2)})
+
+        assert snapshot.base == 'USD'
+        assert snapshot.rate('USD') == 1
+        assert snapshot.rate('EUR') == 2
+        assert snapshot.rate('JPY') is None
+        assert snapshot.quotation('EUR', 'USD') == 0.5
+
+    def test_immutable(self):
+        snapshot = RatesSnapshot('USD', {'EUR': Decimal(2)})
+
+        with pytest.raises(TypeError):
+            snapshot.table['EUR'] = Decimal(4)
+
+    def test_replace(self):
+        snapshot = RatesSnapshot('USD', {'EUR': Decimal(2)})
+        replaced = snapshot.replace(rates={'JPY': Decimal(8)})
+
+        assert snapshot.rate('JPY') is None
+        assert replaced.base == 'USD'
+        assert replaced.rate('EUR') == 2
+        assert replaced.rate('JPY') == 8
+        assert snapshot.replace(base=None).base is None
+
+    def test_copy_on_write(self):
+        backend = SimpleBackend()
+        backend.setrates({'EUR': Decimal(2), 'JPY': Decimal(8)}, base='USD')
+
+        snapshot = backend.snapshot()
+        backend.setrates({'EUR': Decimal(4), 'JPY': Decimal(16)})
+
+        assert snapshot.rate('EUR') == 2
+        assert snapshot.rate('JPY') == 8
+        assert backend.rate('EUR') == 4
+        assert backend.rate('JPY') == 16
+        assert backend.snapshot() is not snapshot
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingBackend(SimpleBackend):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.fail = False
+
+    def rates(self, currencies):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError('loader unavailable')
+        return super().rates(currencies)
+
+
+class TestRefreshingBackend:
+    @staticmethod
+    def make_backend(**kwargs):
+        loader = CountingBackend()
+        loader.setrates({'EUR': Decimal(2), 'JPY': Decimal(8)}, base='USD')
+        clock = FakeClock()
+        return RefreshingBackend(loader, clock=clock, **kwargs), loader, clock
+
+    def test_invalid_loader(self):
+        with pytest.raises(InvalidExchangeBackend):
+            RefreshingBackend(True)
+
+    def test_cold_lookup_does_not_load(self):
+        backend, loader, _ = self.make_backend()
+
+        assert backend.rate('EUR') is None
+        assert loader.calls == 0
+
+        assert backend.refresh()
+        assert loader.calls == 1
+        assert backend.base == 'USD'
+        assert backend.rate('EUR') == 2
+        assert backend.quotation('EUR', 'JPY') is None
+
+        assert backend.refresh()
+        assert backend.quotation('EUR', 'JPY') == 4
+
+    def test_snapshot(self):
+        backend, loader, clock = self.make_backend(ttl=10)
+        backend.refresh(['EUR'])
+
+        snapshot = backend.snapshot()
+        loader.setrate('EUR', Decimal(3))
+        clock.now = 20
+
+        assert backend._due() == ['EUR']
+        assert snapshot.rate('EUR') == 2
+        assert snapshot.quotation('EUR', 'JPY') is None
+        assert sorted(backend._due()) == ['EUR', 'JPY']
+
+        backend.refresh()
+
+        assert snapshot.table == {'EUR': 2}
+        assert backend.snapshot().rate('EUR') == 3
+
+    def test_stale_while_revalidate(self):
+        backend, loader, clock = self.make_backend(ttl=10, ttls={'JPY': 100})
+        backend.refresh(['EUR', 'JPY'])
+
+        loader.setrate('EUR', Decimal(3))
+        clock.now = 20
+
+        assert backend.rate('EUR') == 2
+        assert backend.staleness('EUR') == 20
+
+        backend.refresh()
+
+        assert backend.rate('EUR') == 3
+        assert backend.staleness('EUR') == 0
+        assert backend.staleness('JPY') == 20
+
+    def test_base_change(self):
+        backend, loader, _ = self.make_backend()
+        loader.setrate('GBP', Decimal('0.5'))
+        backend.refresh(['EUR', 'JPY', 'GBP'])
+
+        loader.setrates({'JPY': Decimal(4), 'GBP': Decimal('0.25')}, base='EUR')
+        backend.refresh(['JPY'])
+
+        assert backend.base == 'EUR'
+        assert backend.quotation('EUR', 'JPY') == 4
+        assert backend.quotation('GBP', 'JPY') is None
+        assert backend.staleness('GBP') is None
+        assert sorted(backend._due()) == ['GBP']
+
+        backend.refresh()
+
+        assert backend.quotation('GBP', 'JPY') == 16
+
+    def test_backoff(self):
+        backend, loader, clock = self.make_backend(ttl=10, backoff=5, max_backoff=15)
+        backend.refresh(['EUR'])
+
+        loader.fail = True
+        clock.now = 10
+
+        assert not backend.refresh()
+        assert backend.rate('EUR') == 2
+
+        calls = loader.calls
+        clock.now = 14
+        assert backend.refresh()
+        assert loader.calls == calls
+
+        clock.now = 15
+        assert not backend.refresh()
+        clock.now = 24
+        assert backend.refresh()
+        assert loader.calls == calls + 1
+
+        loader.fail = False
+        clock.now = 25
+        assert backend.refresh()
+        assert backend.staleness('EUR') == 0
+
+    def test_metrics(self):
+        backend, loader, clock = self.make_backend()
+        backend.refresh(['EUR'])
+        clock.now = 3
+        loader.fail = True
+        backend.refresh(['JPY'])
+
+        metrics = backend.metrics()
+
+        assert metrics['loads'] == 1
+        assert metrics['errors'] == 1
+        assert isinstance(metrics['last_error'], ConnectionError)
+        assert metrics['last_load_time'] == 0
+        assert metrics['staleness'] == {'EUR': 3}
+
+    def test_background_thread(self):
+        loader = SimpleBackend()
+        loader.setrates({'EUR': Decimal(2)}, base='USD')
+        backend = RefreshingBackend(loader, interval=0.01)
+
+        backend.start()
+        try:
+            backend.rate('EUR')
+            deadline = time.monotonic() + 5
+            while backend.rate('EUR') is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            backend.stop()
+
+        assert backend.rate('EUR') == 2
+
+    def test_asyncio_task(self):
+        loader = SimpleBackend()
+        loader.setrates({'EUR': Decimal(2)}, base='USD')
+        backend = RefreshingBackend(loader, interval=0.01)
+
+        async def main():
+            backend.rate('EUR')
+            task = backend.start_async()
+            try:
+                while backend.rate('EUR') is None:
+                    await asyncio.sleep(0.01)
+            finally:
+                task.cancel()
+
+        asyncio.run(asyncio.wait_for(main(), 5))
+
+        assert backend.rate('EUR') == 2
+
+
+class TestGraphBackend:
+    @staticmethod
+    def make_backend(strategy='hops'):
+        backend = GraphBackend(strategy)
+        backend.setquote('EUR', 'USD', Decimal(2), timestamp=1)
+        backend.setquote('USD', 'JPY', Decimal(4), timestamp=1)
+        backend.setquote('BTC', 'USDT', Decimal(10), timestamp=1)
+        backend.setquote('USDT', 'USD', Decimal(1), timestamp=1)
+        return backend
+
+    def test_invalid_strategy(self):
+        with pytest.raises(ValueError):
+            GraphBackend('cheapest')
+
+    def test_quotation(self):
+        backend = self.make_backend()
+
+        assert backend.quotation('EUR', 'EUR') == 1
+        assert backend.quotation('EUR', 'USD') == 2
+        assert backend.quotation('USD', 'EUR') == 0.5
+        assert backend.quotation('EUR', 'JPY') == 8
+        assert backend.quotation('BTC', 'JPY') == 40
+        assert backend.quotation('JPY', 'BTC') == Decimal(1) / Decimal(40)
+        assert backend.quotation('EUR', 'GBP') is None
+
+    def test_rate(self):
+        backend = self.make_backend()
+
+        assert backend.rate('JPY') is None
+
+        backend.base = 'USD'
+
+        assert backend.rate('USD') == 1
+        assert backend.rate('JPY') == 4
+        assert backend.rate('EUR') == 0.5
+
+    def test_conversion(self):
+        xrates.backend = self.make_backend()
+        try:
+            assert Money('1', 'BTC').to('JPY') == Money('40', 'JPY')
+        finally:
+            xrates.backend = None
+
+    def test_quotations(self):
+        backend = self.make_backend()
+        backend.base = 'USD'
+
+        assert backend.rates(['EUR', 'GBP']) == {'EUR': Decimal('0.5'), 'GBP': None}
+        assert backend.quotations([('BTC', 'JPY'), ('EUR', 'GBP')]) == {('BTC', 'JPY'): 40, ('EUR', 'GBP'): None}
+
+    def test_path(self):
+        backend = self.make_backend()
+
+        assert backend.path('EUR', 'EUR') == ('EUR',)
+        assert backend.path('EUR', 'JPY') == ('EUR', 'USD', 'JPY')
+        assert backend.path('BTC', 'EUR') == ('BTC', 'USDT', 'USD', 'EUR')
+        assert backend.path('EUR', 'GBP') is None
+
+    def test_rate_update_invalidates_dependents(self):
+        backend = self.make_backend()
+        assert backend.quotation('EUR', 'JPY') == 8
+        assert backend.quotation('BTC', 'USD') == 10
+
+        backend.setquote('USD', 'JPY', Decimal(5))
+
+        assert ('EUR', 'JPY') not in backend._quotes
+        assert ('BTC', 'USD') in backend._quotes
+        assert backend.quotation('EUR', 'JPY') == 10
+
+    def test_removequote_after_rate_update(self):
+        backend = GraphBackend()
+        backend.setquote('EUR', 'USD', Decimal(2))
+        backend.setquote('USD', 'JPY', Decimal(4))
+        assert backend.quotation('EUR', 'JPY') == 8
+
+        backend.setquote('USD', 'JPY', Decimal(5))
+        backend.removequote('USD', 'JPY')
+
+        assert backend.quotation('EUR', 'JPY') is None
+        assert backend.path('EUR', 'JPY') is None
+
+    def test_shortcut(self):
+        backend = self.make_backend()
+        assert backend.path('BTC', 'JPY') == ('BTC', 'USDT', 'USD', 'JPY')
+
+        backend.setquote('BTC', 'JPY', Decimal(41))
+
+        assert backend.path('BTC', 'JPY') == ('BTC', 'JPY')
+        assert backend.quotation('BTC', 'JPY') == 41
+
+    def test_new_currency(self):
+        backend = self.make_backend()
+        assert backend.quotation('EUR', 'GBP') is None
+
+        backend.setquote('GBP', 'EUR', Decimal('1.25'))
+
+        assert backend.quotation('EUR', 'GBP') == Decimal('0.8')
+
+    def test_removequote(self):
+        backend = self.make_backend()
+        assert backend.quotation('BTC', 'JPY') == 40
+
+        backend.removequote('USDT', 'USD')
+
+        assert backend.quotation('BTC', 'JPY') is None
+        assert backend.quotation('EUR', 'JPY') == 8
+
+    def test_fresh_strategy(self):
+        backend = self.make_backend('fresh')
+        backend.setquote('EUR', 'JPY', Decimal(8), timestamp=0)
+
+        assert backend.path('EUR', 'JPY') == ('EUR', 'USD', 'JPY')
+
+        backend.setquote('EUR', 'JPY', Decimal(9), timestamp=2)
+
+        assert backend.path('EUR', 'JPY') == ('EUR', 'JPY')
+        assert backend.quotation('EUR', 'JPY') == 9
+
+    def test_fresh_strategy_fewest_hops_on_ties(self):
+        backend = GraphBackend('fresh')
+        backend.setquote('O', 'X', Decimal(1), timestamp=5)
+        backend.setquote('O', 'Y', Decimal(1), timestamp=10)
+        backend.setquote('Y', 'X', Decimal(1), timestamp=10)
+        backend.setquote('X', 'T', Decimal(1), timestamp=1)
+
+        assert backend.path('O', 'T') == ('O', 'X', 'T')
+        assert backend.path('O', 'X') == ('O', 'Y', 'X')
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+from money import Currency
+from money._precision import CURRENCY_PRECISION
+
+
+def test_babel_imported_lazily():
+    code = (
+        'import sys\n'
+        'from money import Currency, Money\n'
+        'Money("1.234", "USD").amount\n'
+        'assert "babel" not in sys.modules\n'
+        'Money("1.234", "USD").format()\n'
+        'assert "babel" in sys.modules\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_precision_table():
+    from babel.numbers import get_currency_precision
+
+    for code, precision in CURRENCY_PRECISION.items():
+        assert get_currency_precision(code) == precision
+
+
+def test_precision_fallback():
+    assert 'XYZ' not in CURRENCY_PRECISION
+    assert Currency('XYZ').precision == 2
+
+
+def test_public_names():
+    code = (
+        'import money\n'
+        'from money import *\n'
+        'assert money.sum and money.max and money.min\n'
+        'assert sum([1, 2, 3]) == 6 and max(3, 4) == 4 and min(3, 4) == 3\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
@@ -0,0 +1,155 @@
+from decimal import Decimal
+from io import BytesIO, StringIO
+from itertools import count, islice
+
+import pytest
+
+from money import Money, MoneyArray
+from money.io import MAGIC, read_binary, read_csv, write_binary, write_csv
+
+
+def test_read_csv_arrays():
+    fp = StringIO('amount,currency\n1.005,USD\n2,USD\n7,JPY\n3.5,USD\n')
+
+    columns = list(read_csv(fp, header=True))
+
+    assert [(column.currency, column.exponent, column.data.tolist()) for column in columns] == [
+        ('USD', 3, [1005, 2000]),
+        ('JPY', 0, [7]),
+        ('USD', 2, [350]),
+    ]
+
+
+def test_read_csv_exact():
+    text = '1.23456,USD\n7,JPY\n0.5,JPY\n'
+
+    arrays = [value for column in read_csv(StringIO(text)) for value in column]
+
+    assert arrays == list(read_csv(StringIO(text), as_array=False))
+    assert arrays == [Money('1.23456', 'USD'), Money('7', 'JPY'), Money('0.5', 'JPY')]
+
+    with pytest.raises(ValueError):
+        list(read_csv(StringIO('123456789012345678901234,USD\n')))
+
+
+def test_read_csv_splits_runs_on_overflow():
+    text = '1000000000,USD\n0.0000000001,USD\n2,USD\n'
+
+    columns = list(read_csv(StringIO(text)))
+
+    assert [(column.exponent, column.data.tolist()) for column in columns] == [(2, [100000000000]), (10, [1, 20000000000])]
+    assert [value for column in columns for value in column] == list(read_csv(StringIO(text), as_array=False))
+
+
+def test_read_csv_chunks():
+    fp = StringIO(''.join(f"{i},USD\n" for i in range(5)))
+
+    columns = list(read_csv(fp, chunk_size=2))
+
+    assert [len(column) for column in columns] == [2, 2, 1]
+
+
+def test_read_csv_money():
+    fp = StringIO('1.005,USD\n7,JPY\n')
+
+    assert list(read_csv(fp, as_array=False)) == [Money('1.005', 'USD'), Money('7', 'JPY')]
+
+
+def test_read_csv_lazy():
+    lines = (f"{i},USD\n" for i in count())
+
+    first = next(read_csv(lines, chunk_size=3))
+
+    assert first.data.tolist() == [0, 100, 200]
+
+
+def test_read_csv_blank_lines():
+    fp = StringIO('1,USD\n\n2,USD\n\n')
+
+    assert list(read_csv(fp, as_array=False)) == [Money(1, 'USD'), Money(2, 'USD')]
+
+
+@pytest.mark.parametrize('text', ['1,USD\n2\n', '1,USD\nabc,USD\n', '1,USD\n2,usd\n', '1,USD\n2,USD,x\n'])
+def test_read_csv_malformed(text):
+    for as_array in (True, False):
+        with pytest.raises(ValueError, match='line 2'):
+            list(read_csv(StringIO(text), as_array=as_array))
+
+
+def test_write_csv():
+    fp = StringIO()
+
+    write_csv(fp, [Money('1.005', 'USD'), MoneyArray([101, 7], 'EUR')], chunk_size=1, header=True)
+
+    assert fp.getvalue().splitlines() == ['amount,currency', '1.005,USD', '1.01,EUR', '0.07,EUR']
+
+
+def test_binary_roundtrip():
+    fp = BytesIO()
+    values = [Money('1.005', 'USD'), Money('2', 'USD'), Money('7', 'JPY'), MoneyArray([1, 2, 3], 'USD', exponent=4)]
+
+    write_binary(fp, values, chunk_size=2)
+    fp.seek(0)
+
+    assert fp.getvalue().startswith(MAGIC)
+    assert [(column.currency, column.exponent, column.data.tolist()) for column in read_binary(fp)] == [
+        ('USD', 3, [1005, 2000]),
+        ('JPY', 0, [7]),
+        ('USD', 4, [1, 2]),
+        ('USD', 4, [3]),
+    ]
+
+    fp.seek(0)
+
+    assert list(read_binary(fp, as_array=False)) == [
+        Money('1.005', 'USD'), Money('2', 'USD'), Money('7', 'JPY'),
+        Money('0.0001', 'USD'), Money('0.0002', 'USD'), Money('0.0003', 'USD'),
+    ]
+
+
+def test_binary_exact():
+    fp = BytesIO()
+    write_binary(fp, [Money('1.23456', 'USD'), Money('-0.5', 'JPY')])
+    fp.seek(0)
+
+    assert list(read_binary(fp, as_array=False)) == [Money('1.23456', 'USD'), Money('-0.5', 'JPY')]
+
+    with pytest.raises(ValueError):
+        write_binary(BytesIO(), [Money('1E+30', 'USD')])
+
+    with pytest.raises(ValueError, match='Exponent 130'):
+        write_binary(BytesIO(), [Money('1E-130', 'USD')])
+
+    values = [Money('1000000000', 'USD'), Money('0.0000000001', 'USD')]
+    fp = BytesIO()
+    write_binary(fp, values)
+    fp.seek(0)
+
+    assert list(read_binary(fp, as_array=False)) == values
+
+
+def test_binary_lazy():
+    fp = BytesIO()
+    write_binary(fp, (Money(i, 'USD') for i in range(10)), chunk_size=4)
+    fp.seek(0)
+
+    first = next(read_binary(fp))
+
+    assert list(first) == [Money(Decimal(i), 'USD') for i in range(4)]
+
+
+def test_binary_invalid():
+    with pytest.raises(ValueError):
+        read_binary(BytesIO(b'not a ledger'))
+
+    fp = BytesIO()
+    write_binary(fp, [Money(1, 'USD')])
+
+    with pytest.raises(ValueError):
+        list(read_binary(BytesIO(fp.getvalue()[:-1])))
+
+    with pytest.raises(ValueError):
+        list(islice(read_binary(BytesIO(MAGIC + b'\x01X')), 1))
+
+    with pytest.raises(ValueError, match='undefined currency'):
+        list(read_binary(BytesIO(MAGIC + b'\x01R' + bytes(6))))
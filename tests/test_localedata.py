@@ -0,0 +1,88 @@
+import subprocess
+import sys
+from io import StringIO
+
+import pytest
+
+from money import Currency
+from money.localedata import LocaleData, locale_data
+
+
+def test_lookup():
+    data = LocaleData()
+
+    assert data.symbol('USD') == '$'
+    assert data.symbol('USD', 'pt_PT') == 'US$'
+    assert data.display_name('USD', 'de_DE') == 'US-Dollar'
+    assert ('USD', 'pt_PT') in data
+    assert len(data) == 3
+
+
+def test_build():
+    data = LocaleData()
+    data.build([Currency('USD'), 'EUR'], ['en_US', 'pt_PT'])
+
+    assert len(data) == 4
+    assert ('EUR', 'pt_PT') in data
+    assert ('JPY', 'pt_PT') not in data
+
+
+def test_save_load():
+    data = LocaleData()
+    data.build(['USD', 'EUR'], ['en_US', 'de_DE'])
+    fp = StringIO()
+    data.save(fp)
+    fp.seek(0)
+
+    loaded = LocaleData()
+    loaded.load(fp)
+
+    assert len(loaded) == 4
+    assert loaded.symbol('EUR', 'de_DE') == '€'
+    assert loaded.display_name('USD') == 'US Dollar'
+
+    with pytest.raises(ValueError):
+        loaded.load(StringIO('{"version": 0}'))
+
+
+@pytest.mark.parametrize('text', [
+    '{"version": 1}',
+    '{"version": 1, "locales": []}',
+    '{"version": 1, "locales": {"en_US": ["USD"]}}',
+    '{"version": 1, "locales": {"en_US": {"USD": ["$"]}}}',
+    '{"version": 1, "locales": {"en_US": {"USD": "$"}}}',
+    '{"version": 1, "locales": {"en_US": {"USD": [1, 2]}}}',
+])
+def test_load_malformed(text):
+    data = LocaleData()
+
+    with pytest.raises(ValueError, match='Not a supported locale data file'):
+        data.load(StringIO(text))
+    assert len(data) == 0
+
+
+def test_load_avoids_babel():
+    fp = StringIO()
+    data = LocaleData()
+    data.build(['USD'], ['pt_PT'])
+    data.save(fp)
+
+    code = (
+        'import io, sys\n'
+        'from money import Currency\n'
+        'from money.localedata import locale_data\n'
+        f"locale_data.load(io.StringIO({fp.getvalue()!r}))\n"
+        'assert Currency("USD").symbol("pt_PT") == "US$"\n'
+        'assert "babel" not in sys.modules\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_currency_uses_table():
+    locale_data.clear()
+    try:
+        Currency('USD').symbol('pt_PT')
+
+        assert ('USD', 'pt_PT') in locale_data
+    finally:
+        locale_data.clear()
@@ -95,6 +95,9 @@ def test_ne():
 def test_hash():
     assert hash(Money(8, 'EUR')) == hash(Money('8', 'EUR'))
     assert not hash(Money(8, 'EUR')) == hash(Money('8', 'USD'))
+    assert hash(Money(8, 'EUR')) == hash((Decimal(8), 'EUR'))
+
+    assert len({Money(8, 'EUR'), Money('8.0', 'EUR'), Money(8, 'USD')}) == 2
 
 
 def test_lt():
@@ -0,0 +1,83 @@
+import json
+from decimal import Decimal
+from io import StringIO
+
+import money
+from money import Money, xrates
+
+
+def setup_module():
+    xrates.backend = 'money.exchange.SimpleBackend'
+    xrates.base = 'USD'
+    xrates.setrate('EUR', Decimal(2))
+
+
+def teardown_module():
+    xrates.backend = None
+
+
+def test_profile():
+    with money.profile() as p:
+        Money(4, 'USD') + Money(2, 'EUR')
+        Money(4, 'USD') * 2
+        Money(4, 'USD') < Money(2, 'USD')
+        _ = Money('4.567', 'USD').amount
+        Money(4, 'USD').format()
+
+    operations = p.operations()
+
+    assert operations['add'][0] == 1
+    assert operations['mul'][0] == 2
+    assert operations['lt'][0] == 1
+    assert operations['to'][0] == 2
+    assert operations['amount'][0] == 1
+    assert operations['format'][0] == 1
+    assert all(elapsed >= 0 for _, elapsed in operations.values())
+
+    pairs = {(pair['operation'], pair['origin'], pair['target']) for pair in p.as_dict()['pairs']}
+
+    assert ('add', 'USD', 'EUR') in pairs
+    assert ('to', 'EUR', 'USD') in pairs
+    assert ('mul', 'USD', 'USD') in pairs
+
+
+def test_restores_operations():
+    originals = {name: Money.__dict__[name] for name in ('__add__', 'to', 'format', 'amount')}
+
+    with money.profile():
+        assert Money.__dict__['__add__'] is not originals['__add__']
+
+    assert {name: Money.__dict__[name] for name in originals} == originals
+
+    with money.profile() as p:
+        pass
+    Money(4, 'USD') + 4
+
+    assert p.operations() == {}
+
+
+def test_nested():
+    with money.profile() as outer:
+        Money(4, 'USD') + 4
+        with money.profile() as inner:
+            Money(4, 'USD') - 4
+        Money(4, 'USD') + 4
+
+    assert outer.operations()['add'][0] == 2
+    assert outer.operations()['sub'][0] == 1
+    assert set(inner.operations()) == {'sub'}
+
+
+def test_summary_and_dump():
+    with money.profile() as p:
+        Money(4, 'USD') + Money(2, 'EUR')
+
+    summary = p.summary().splitlines()
+
+    assert summary[0].split() == ['operation', 'origin', 'target', 'calls', 'total', 'ms', 'mean', 'us']
+    assert [line.split()[0] for line in summary[1:]] == ['add', 'to', 'mul']
+
+    fp = StringIO()
+    p.dump(fp)
+
+    assert json.loads(fp.getvalue()) == p.as_dict()
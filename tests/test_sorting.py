@@ -0,0 +1,136 @@
+from decimal import Decimal
+
+import pytest
+
+import money
+from money import Money, key_for, xrates
+from money.exceptions import ExchangeBackendNotSet, ExchangeRateNotFound
+from money.exchange import BaseBackend, RefreshingBackend, SimpleBackend
+
+
+class CountingBackend(BaseBackend):
+    def __init__(self, base, rates):
+        self._base = base
+        self._rates = rates
+        self.calls = 0
+
+    @property
+    def base(self):
+        return self._base
+
+    def rate(self, currency):
+        return Decimal(1) if currency == self._base else self._rates.get(currency, None)
+
+    def rates(self, currencies):
+        self.calls += 1
+        return super().rates(currencies)
+
+
+def setup_module():
+    xrates.backend = 'money.exchange.SimpleBackend'
+    xrates.base = 'USD'
+    xrates.setrate('EUR', Decimal(2))
+    xrates.setrate('JPY', Decimal(100))
+
+
+def teardown_module():
+    xrates.backend = None
+
+
+def test_key_for():
+    key = key_for('USD')
+
+    assert key(Money(4, 'USD')) == Decimal(4)
+    assert key(Money(4, 'EUR')) == Decimal(2)
+    assert key(Money(400, 'JPY')) == Decimal(4)
+    assert type(key(Money(4, 'EUR'))) is Decimal
+
+
+def test_key_for_quotes_once():
+    backend = CountingBackend('USD', {'EUR': Decimal(2), 'JPY': Decimal(100)})
+
+    values = [Money(i, code) for i in range(50) for code in ('USD', 'EUR', 'JPY')]
+    sorted(values, key=key_for('USD', backend, currencies=['EUR', 'JPY']))
+
+    assert backend.calls == 1
+
+    money.sort(values, backend=backend)
+    money.max(values, backend=backend)
+    money.sum(values, backend=backend)
+
+    assert backend.calls == 4
+
+
+def test_key_for_errors():
+    with pytest.raises(ExchangeRateNotFound):
+        key_for('USD')(Money(4, 'GBP'))
+
+    with pytest.raises(ExchangeRateNotFound):
+        key_for('USD', SimpleBackend())(Money(4, 'EUR'))
+
+    xrates.backend = None
+    try:
+        key = key_for('USD')
+
+        assert key(Money(4, 'USD')) == 4
+
+        with pytest.raises(ExchangeBackendNotSet):
+            key(Money(4, 'EUR'))
+    finally:
+        setup_module()
+
+
+def test_sort():
+    values = [Money(3, 'USD'), Money(4, 'EUR'), Money(150, 'JPY'), Money(1, 'USD')]
+
+    assert money.sort(values) == [values[3], values[2], values[1], values[0]]
+    assert money.sort(values, reverse=True) == [values[0], values[1], values[2], values[3]]
+    assert money.sort(values, in_currency='JPY') == money.sort(values)
+    assert money.sort([]) == []
+
+
+def test_sort_matches_comparisons():
+    values = [Money(3, 'USD'), Money(4, 'EUR'), Money(150, 'JPY'), Money(1, 'USD'), Money('1.5', 'EUR')]
+
+    assert money.sort(values) == sorted(values)
+
+
+def test_max_min():
+    values = [Money(3, 'USD'), Money(4, 'EUR'), Money(150, 'JPY')]
+
+    assert money.max(values) == Money(3, 'USD')
+    assert money.min(values) == Money(150, 'JPY')
+
+    with pytest.raises(ValueError):
+        money.max([])
+
+    with pytest.raises(ValueError):
+        money.min([])
+
+
+def test_sum():
+    values = [Money(3, 'USD'), Money(4, 'EUR'), Money(150, 'JPY')]
+
+    assert money.sum(values) == Money('6.5', 'USD')
+    assert money.sum(values) == values[0] + values[1] + values[2]
+    assert money.sum(values, in_currency='EUR') == Money(13, 'EUR')
+    assert money.sum([], in_currency='USD') == Money(0, 'USD')
+
+    with pytest.raises(ValueError):
+        money.sum([])
+
+    with pytest.raises(ExchangeRateNotFound):
+        money.sum([Money(1, 'USD'), Money(1, 'GBP')])
+
+
+def test_sum_queues_refreshing_backend():
+    loader = SimpleBackend()
+    loader.setrates({'EUR': Decimal(2)}, base='USD')
+    backend = RefreshingBackend(loader)
+
+    with pytest.raises(ExchangeRateNotFound, match='RefreshingBackend'):
+        money.sum([Money(1, 'USD'), Money(1, 'EUR')], backend=backend)
+    assert 'EUR' in backend._due()
+
+    backend.refresh()
+    assert money.sum([Money(1, 'USD'), Money(1, 'EUR')], backend=backend) == Money('1.5', 'USD')